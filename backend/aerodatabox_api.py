@@ -7,38 +7,55 @@ AeroDataBox via RapidAPI provides HTTPS on free tier with 300 requests/month.
 API Documentation: https://rapidapi.com/aedbx-aedbx/api/aerodatabox
 Free tier: 300 requests/month, HTTPS included
 """
+import logging
 import os
 import random
+import re
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson  # optional: much faster on large airport boards
+except ImportError:
+    orjson = None
+
+log = logging.getLogger('wildpass.aerodatabox')
 
 
 # =============================================================================
 # Mock data generators (fallback when API is unavailable)
 # =============================================================================
 
-MOCK_DESTINATIONS = {
-    'DEN': [
+MOCK_DESTINATIONS = MappingProxyType({
+    'DEN': (
         ('LAS', 'Las Vegas'), ('PHX', 'Phoenix'), ('LAX', 'Los Angeles'),
         ('SFO', 'San Francisco'), ('SEA', 'Seattle'), ('ORD', 'Chicago'),
         ('ATL', 'Atlanta'), ('MCO', 'Orlando'), ('MIA', 'Miami'), ('DFW', 'Dallas')
-    ],
-    'LAS': [
+    ),
+    'LAS': (
         ('DEN', 'Denver'), ('LAX', 'Los Angeles'), ('SFO', 'San Francisco'),
         ('PHX', 'Phoenix'), ('SEA', 'Seattle'), ('ORD', 'Chicago')
-    ],
-    'PHX': [
+    ),
+    'PHX': (
         ('DEN', 'Denver'), ('LAS', 'Las Vegas'), ('LAX', 'Los Angeles'),
         ('SFO', 'San Francisco'), ('ORD', 'Chicago'), ('ATL', 'Atlanta')
-    ],
-}
+    ),
+})
 
-DEFAULT_DESTINATIONS = [
+DEFAULT_DESTINATIONS = (
     ('DEN', 'Denver'), ('LAS', 'Las Vegas'), ('PHX', 'Phoenix'),
     ('LAX', 'Los Angeles'), ('ORD', 'Chicago'), ('ATL', 'Atlanta')
-]
+)
 
-AIRPORT_NAMES = {
+AIRPORT_NAMES = MappingProxyType({
     'DEN': 'Denver International Airport',
     'LAS': 'Harry Reid International Airport',
     'PHX': 'Phoenix Sky Harbor International Airport',
@@ -53,61 +70,84 @@ AIRPORT_NAMES = {
     'FLL': 'Fort Lauderdale-Hollywood International Airport',
     'TPA': 'Tampa International Airport',
     'SAN': 'San Diego International Airport',
+})
+
+
+# Mock destination lists with the airport itself already filtered out
+_MOCK_DESTINATIONS_FILTERED = {
+    airport: tuple(d for d in dests if d[0] != airport)
+    for airport, dests in MOCK_DESTINATIONS.items()
 }
 
 
+@lru_cache(maxsize=64)
+def _default_destinations_for(airport_code):
+    """DEFAULT_DESTINATIONS minus airport_code, for airports without their own list."""
+    return tuple(d for d in DEFAULT_DESTINATIONS if d[0] != airport_code)
+
+
+_MOCK_AIRLINES = (
+    ('F9', 'Frontier Airlines'), ('UA', 'United Airlines'), ('AA', 'American Airlines'),
+    ('DL', 'Delta Air Lines'), ('WN', 'Southwest Airlines'), ('NK', 'Spirit Airlines'),
+    ('B6', 'JetBlue Airways'), ('AS', 'Alaska Airlines'),
+)
+_MOCK_STATUSES = ('scheduled', 'scheduled', 'scheduled', 'active', 'landed', 'delayed')
+_MOCK_DELAYS = (0, 0, 0, 15, 30, 45)
+
+
 def _generate_mock_flights(airport_code, flight_type='departures', count=8):
     """Generate realistic mock flight data for fallback."""
-    destinations = MOCK_DESTINATIONS.get(airport_code, DEFAULT_DESTINATIONS)
-    destinations = [(code, name) for code, name in destinations if code != airport_code]
-
-    flights = []
-    statuses = ['scheduled', 'scheduled', 'scheduled', 'active', 'landed', 'delayed']
+    destinations = (_MOCK_DESTINATIONS_FILTERED.get(airport_code)
+                    or _default_destinations_for(airport_code))
+    n = min(count, len(destinations) * 2)
     base_time = datetime.now()
+    airport_city = 'Denver' if airport_code == 'DEN' else airport_code
+
+    # Draw every random field for the whole board up front
+    draws = zip(
+        random.choices(_MOCK_AIRLINES, k=n),
+        random.choices(range(100, 3000), k=n),
+        random.choices(_MOCK_STATUSES, k=n),
+        random.choices(range(-60, 181), k=n),
+        random.choices(_MOCK_DELAYS, k=n),
+        random.choices('ABC', k=n),
+        random.choices('ABC', k=n),
+        random.choices(range(1, 51), k=n),
+        random.choices(('A320', 'A321', 'A319'), k=n),
+    )
 
-    for i in range(min(count, len(destinations) * 2)):
+    flights = []
+    for i, (airline, number, status, dep_offset, delay, terminal, gate_letter,
+            gate_number, aircraft) in enumerate(draws):
         dest_code, dest_name = destinations[i % len(destinations)]
-        mock_airlines = [
-            ('F9', 'Frontier Airlines'), ('UA', 'United Airlines'), ('AA', 'American Airlines'),
-            ('DL', 'Delta Air Lines'), ('WN', 'Southwest Airlines'), ('NK', 'Spirit Airlines'),
-            ('B6', 'JetBlue Airways'), ('AS', 'Alaska Airlines'),
-        ]
-        al_code, al_name = random.choice(mock_airlines)
-        flight_num = f"{al_code}{random.randint(100, 2999)}"
-        status = random.choice(statuses)
-
-        dep_offset = timedelta(minutes=random.randint(-60, 180))
-        scheduled_dep = base_time + dep_offset
-        flight_duration = timedelta(hours=random.randint(1, 4), minutes=random.randint(0, 59))
-        scheduled_arr = scheduled_dep + flight_duration
-
-        delay_minutes = random.choice([0, 0, 0, 15, 30, 45]) if status == 'delayed' else 0
+        al_code, al_name = airline
+        scheduled_dep = base_time + timedelta(minutes=dep_offset)
+        delay_minutes = delay if status == 'delayed' else 0
 
         flight = {
-            'flight_number': flight_num,
+            'flight_number': f"{al_code}{number}",
             'origin': airport_code if flight_type == 'departures' else dest_code,
-            'origin_city': 'Denver' if airport_code == 'DEN' else airport_code,
+            'origin_city': airport_city,
             'destination': dest_code if flight_type == 'departures' else airport_code,
-            'destination_city': dest_name if flight_type == 'departures' else (
-                'Denver' if airport_code == 'DEN' else airport_code),
+            'destination_city': dest_name if flight_type == 'departures' else airport_city,
             'status': status,
             'status_display': _get_status_display(status),
             'scheduled_time': scheduled_dep.strftime('%I:%M %p'),
             'scheduled': {'local': scheduled_dep.strftime('%I:%M %p')},
             'actual': {
                 'local': (scheduled_dep + timedelta(minutes=delay_minutes)).strftime('%I:%M %p')
-            } if status in ['active', 'landed', 'delayed'] else None,
-            'delay': f"+{delay_minutes} min" if delay_minutes > 0 else 'On time',
-            'terminal': random.choice(['A', 'B', 'C']),
-            'gate': f"{random.choice(['A', 'B', 'C'])}{random.randint(1, 50)}",
-            'aircraft': random.choice(['A320', 'A321', 'A319']),
+            } if status in ('active', 'landed', 'delayed') else None,
+            'delay': _format_delay(delay_minutes) or 'On time',
+            'terminal': terminal,
+            'gate': f"{gate_letter}{gate_number}",
+            'aircraft': aircraft,
             'airline': {'name': al_name, 'iata': al_code},
             'airline_name': al_name,
         }
-        flights.append(flight)
+        flights.append((scheduled_dep, flight))
 
-    flights.sort(key=lambda x: x.get('scheduled_time', ''))
-    return flights
+    flights.sort(key=lambda pair: pair[0])
+    return [flight for _, flight in flights]
 
 
 def _generate_mock_single_flight(flight_number):
@@ -151,49 +191,158 @@ def _generate_mock_single_flight(flight_number):
     }
 
 
+_STATUS_DISPLAY = MappingProxyType({
+    'scheduled': '🕐 Scheduled',
+    'active': '✈️ In Flight',
+    'landed': '✅ Landed',
+    'cancelled': '❌ Cancelled',
+    'incident': '⚠️ Incident',
+    'diverted': '↪️ Diverted',
+    'delayed': '⏰ Delayed',
+    'unknown': '❓ Unknown',
+})
+
+# AeroDataBox status strings (lowercased) -> our standard status codes
+_STATUS_MAP = MappingProxyType({
+    'scheduled': 'scheduled',
+    'expected': 'scheduled',
+    'departed': 'active',
+    'en route': 'active',
+    'airborne': 'active',
+    'approaching': 'active',
+    'arrived': 'landed',
+    'landed': 'landed',
+    'cancelled': 'cancelled',
+    'canceled': 'cancelled',
+    'diverted': 'diverted',
+    'delayed': 'delayed',
+    'unknown': 'unknown',
+})
+
+
+@lru_cache(maxsize=128)
+def _format_delay(minutes):
+    """Display string for a delay in minutes ('+15 min'), or None if not delayed."""
+    return f"+{minutes} min" if minutes and minutes > 0 else None
+
+
+@lru_cache(maxsize=32)
 def _get_status_display(status):
     """Get display-friendly status string with emoji."""
-    status_map = {
-        'scheduled': '🕐 Scheduled',
-        'active': '✈️ In Flight',
-        'landed': '✅ Landed',
-        'cancelled': '❌ Cancelled',
-        'incident': '⚠️ Incident',
-        'diverted': '↪️ Diverted',
-        'delayed': '⏰ Delayed',
-        'unknown': '❓ Unknown',
-    }
-    return status_map.get(status, status_map['unknown'])
+    return _STATUS_DISPLAY.get(status, _STATUS_DISPLAY['unknown'])
+
+
+@lru_cache(maxsize=32)
+def _map_status(raw_status):
+    """Map AeroDataBox status strings to our standard status codes."""
+    return _STATUS_MAP.get(raw_status.lower().strip(), 'unknown')
 
 
 # Common ICAO 3-letter to IATA 2-letter airline code mapping
-ICAO_TO_IATA = {
+ICAO_TO_IATA = MappingProxyType({
     'AAL': 'AA', 'DAL': 'DL', 'UAL': 'UA', 'SWA': 'WN', 'FFT': 'F9',
     'NKS': 'NK', 'JBU': 'B6', 'ASA': 'AS', 'AAY': 'G4', 'HAL': 'HA',
     'SCX': 'SY', 'BAW': 'BA', 'AFR': 'AF', 'DLH': 'LH', 'ACA': 'AC',
     'KLM': 'KL', 'EIN': 'EI', 'RYR': 'FR', 'EZY': 'U2', 'VOI': 'VY',
     'ANA': 'NH', 'JAL': 'JL', 'CPA': 'CX', 'QFA': 'QF', 'UAE': 'EK',
     'ETH': 'ET', 'THY': 'TK', 'SIA': 'SQ', 'CSN': 'CZ', 'CCA': 'CA',
-}
+})
+
+
+# ISO 8601 durations as AeroDataBox sends them: "PT15M", "PT1H5M", "PT1H"
+_ISO_DURATION_RE = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?(?:\d+(?:\.\d+)?S)?$', re.IGNORECASE)
+_ICAO_FLIGHT_RE = re.compile(r'^([A-Z]{3})(\d+)$')
 
 
 def _icao_to_iata(flight_num):
     """Convert ICAO airline prefix to IATA if matched (e.g., AAL3075 → AA3075)."""
-    import re
-    match = re.match(r'^([A-Z]{3})(\d+)$', flight_num)
+    match = _ICAO_FLIGHT_RE.match(flight_num)
     if match:
-        icao_code = match.group(1)
-        number = match.group(2)
-        iata = ICAO_TO_IATA.get(icao_code)
+        iata = ICAO_TO_IATA.get(match.group(1))
         if iata:
-            return f"{iata}{number}"
+            return f"{iata}{match.group(2)}"
     return flight_num
 
 
+def _decode_json(response):
+    """Decode a response body with orjson when available, else requests' json."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _normalize_flight_number(flight_number):
+    """Strip separators, uppercase, and convert a 3-letter ICAO prefix to IATA."""
+    flight_num = flight_number.replace('-', '').replace(' ', '').upper()
+    return _icao_to_iata(flight_num)
+
+
+# AeroDataBox local times look like "2026-02-23 14:30+01:00" or
+# "2026-02-23T14:30:00"; the fast path only needs the wall-clock prefix.
+_LOCAL_TIME_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2})')
+
+
+@lru_cache(maxsize=512)
+def _parse_local_time(time_str):
+    """
+    Parse an AeroDataBox local time string to app format.
+
+    Memoized because the same timestamps repeat across scheduled/estimated/
+    actual fields and across refreshes of the same board. Callers must not
+    mutate the returned dict.
+    """
+    try:
+        match = _LOCAL_TIME_RE.match(time_str)
+        if match:
+            dt = datetime(int(match[1]), int(match[2]), int(match[3]),
+                          int(match[4]), int(match[5]))
+        else:
+            clean = time_str.replace(' ', 'T')
+            # Handle timezone offset
+            if '+' in clean and 'T' in clean:
+                dt_part = clean.split('+')[0]
+            elif clean.endswith('Z'):
+                dt_part = clean[:-1]
+            else:
+                dt_part = clean
+            dt = datetime.fromisoformat(dt_part)
+        return {
+            'iso': time_str,
+            'time': dt.strftime('%I:%M %p'),
+            'date': dt.strftime('%Y-%m-%d'),
+            'full': dt.strftime('%b %d, %I:%M %p'),
+            'minute_of_day': dt.hour * 60 + dt.minute,
+        }
+    except (ValueError, TypeError):
+        return {'iso': time_str, 'time': time_str, 'date': None, 'full': time_str}
+
+
+# Sorts after every real minute of the day
+_UNKNOWN_MINUTE = 24 * 60
+
+
+def _board_sort_key(flight):
+    """
+    Sort key for formatted board items: scheduled minute of the day.
+
+    Sorting the '%I:%M %p' display strings put 12:xx AM after 01:xx AM and
+    mixed AM/PM; flights without a parseable time go last.
+    """
+    return (flight.get('scheduled') or {}).get('minute_of_day', _UNKNOWN_MINUTE)
+
+
 # =============================================================================
 # AeroDataBox Real-Time Flight Service
 # =============================================================================
 
+# One response-cache record. A namedtuple keeps tuple-sized slots (no per-entry
+# __dict__) while giving the fields names; times are on the monotonic clock.
+_CacheEntry = namedtuple('_CacheEntry', 'expires_at generated_at payload etag')
+# Cached departures board: the unfiltered board payload plus its route/airline
+# index, built from a single fetch so every departures lookup shares it
+_DeparturesBoard = namedtuple('_DeparturesBoard', 'board index')
+
+
 class RealTimeFlightService:
     """
     Real-time flight status using AeroDataBox API (via RapidAPI).
@@ -205,12 +354,46 @@ class RealTimeFlightService:
     RAPIDAPI_HOST = "aerodatabox.p.rapidapi.com"
     BASE_URL = f"https://{RAPIDAPI_HOST}"
 
+    # Response cache TTLs (seconds), chosen per flight status so we don't burn
+    # the 300 req/month quota re-fetching data that can't have changed yet.
+    TTL_FINISHED = 75 * 60        # landed / cancelled / diverted
+    TTL_SCHEDULED_MAX = 12 * 3600  # scheduled / delayed: until departure, capped
+    TTL_ETA_PADDING = 2 * 60      # in flight: until ETA + 2 min
+    TTL_DEFAULT = 5 * 60          # status or times unknown
+    TTL_MIN = 60
+    MAX_CONCURRENT_REQUESTS = 8   # stay under AeroDataBox's per-second cap
+    MAX_BATCH_FLIGHTS = 20        # per get_flight_statuses call; each miss spends quota
+    NEGATIVE_TTL = 30             # skip the API this long after a failure
+    STALE_MAX_AGE = 24 * 3600     # drop entries this old; too stale to serve
+    SWEEP_INTERVAL = 5 * 60       # how often the background sweeper runs
+
     def __init__(self, api_key=None):
         self.api_key = api_key or os.environ.get('AERODATABOX_API_KEY')
         self.headers = {
             'X-RapidAPI-Key': self.api_key or '',
             'X-RapidAPI-Host': self.RAPIDAPI_HOST,
         }
+        # One pooled session so repeat calls reuse the TLS connection to RapidAPI
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        ))
+        self._pool = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        # key -> _CacheEntry(expires_at, generated_at, payload, etag).
+        # Expired entries are kept so they can be served stale when the API
+        # fails, and their ETag lets refreshes come back as 304 Not Modified.
+        self._cache = {}
+        # key -> backoff expires_at monotonic, set when AeroDataBox fails
+        self._neg_cache = {}
+        self._metrics = Counter()
+        self._cache_lock = threading.RLock()
+        # Cache keys include the date, so without a sweep old days pile up forever
+        threading.Thread(target=self._sweep_loop, daemon=True,
+                         name='aerodatabox-cache-sweep').start()
 
     def is_configured(self):
         return bool(self.api_key)
@@ -231,180 +414,148 @@ class RealTimeFlightService:
         Returns:
             Flight status dict or mock data
         """
-        flight_num = flight_number.replace('-', '').replace(' ', '').upper()
+        return self._get_flight_status(flight_number)
 
-        # Convert 3-letter ICAO airline prefix to 2-letter IATA
-        flight_num = _icao_to_iata(flight_num)
+    def _get_flight_status(self, flight_number, count_lookup=True):
+        """Body of get_flight_status; count_lookup=False skips metrics for an already-counted probe."""
+        flight_num = _normalize_flight_number(flight_number)
 
         if not self.api_key:
-            print("⚠️ AeroDataBox API key not configured — using mock data")
-            result = _generate_mock_single_flight(flight_num)
-            result['mock_data'] = True
-            return result
+            log.debug("AeroDataBox API key not configured — using mock data")
+            return self._mock_flight_status(flight_num)
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        cache_key = ('flight_status', flight_num, None, today)
+        cached = self._cache_get(cache_key, count=count_lookup)
+        if cached is not None:
+            return cached
+        if self._in_backoff(cache_key):
+            return self._stale_or_mock(cache_key, self._mock_flight_status, flight_num)
 
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
             url = f"{self.BASE_URL}/flights/number/{flight_num}/{today}"
 
-            response = requests.get(url, headers=self.headers, timeout=15)
+            with self._request_slots:
+                response = self.session.get(url, headers=self._conditional_headers(cache_key), timeout=15)
 
+            if response.status_code == 304:
+                revalidated = self._cache_revalidate(cache_key)
+                if revalidated is not None:
+                    return revalidated
             if response.status_code == 404:
                 return {'error': f'No flight found for {flight_number}', 'mock_data': False}
             if response.status_code != 200:
-                print(f"⚠️ AeroDataBox API error ({response.status_code}) — using mock data")
-                result = _generate_mock_single_flight(flight_num)
-                result['mock_data'] = True
-                return result
+                log.warning("AeroDataBox API error (%s) — using fallback data", response.status_code)
+                self._start_backoff(cache_key)
+                return self._stale_or_mock(cache_key, self._mock_flight_status, flight_num)
 
-            flights = response.json()
+            flights = _decode_json(response)
             if not flights or (isinstance(flights, list) and len(flights) == 0):
                 return {'error': f'No flight found for {flight_number}', 'mock_data': False}
 
             # AeroDataBox returns a list; take the first entry
             flight_data = flights[0] if isinstance(flights, list) else flights
-            result = self._format_aerodatabox_flight(flight_data, flight_num)
+            result = self._format_aerodatabox_flight(flight_data, flight_num, today)
             result['mock_data'] = False
+            self._cache_put(cache_key, result, self._flight_ttl(result, datetime.now(timezone.utc)),
+                            response.headers.get('ETag'))
             return result
 
         except Exception as e:
-            print(f"⚠️ AeroDataBox exception: {e} — using mock data")
-            result = _generate_mock_single_flight(flight_num)
-            result['mock_data'] = True
-            return result
+            log.warning("AeroDataBox exception: %s — using fallback data", e)
+            self._start_backoff(cache_key)
+            return self._stale_or_mock(cache_key, self._mock_flight_status, flight_num)
 
-    def get_route_flights(self, origin, destination, airline_code=None):
+    def get_flight_statuses(self, flight_numbers):
         """
-        Get all flights for a specific route today.
+        Get real-time status for several flights at once.
 
-        Uses departures endpoint filtered by destination.
-        """
-        def _mock():
-            mock_flights = [
-                _generate_mock_single_flight(f"{random.choice(['F9','UA','AA','DL','WN','NK'])}{random.randint(100, 2999)}")
-                for _ in range(random.randint(1, 3))
-            ]
-            return {
-                'route': f"{origin} → {destination}",
-                'airline': airline_code,
-                'count': len(mock_flights),
-                'flights': mock_flights,
-                'last_updated': datetime.now().isoformat(),
-                'mock_data': True,
-            }
+        Flight numbers are normalized and deduplicated; cached flights are
+        answered locally and the rest are looked up in parallel on the
+        service's thread pool.
 
-        if not self.api_key:
-            print("⚠️ AeroDataBox API key not configured — using mock data")
-            return _mock()
+        Args:
+            flight_numbers: list of flight numbers, in any format get_flight_status accepts
 
-        try:
-            # Get departures from origin, then filter by destination
-            now = datetime.now()
-            from_local = now.replace(hour=0, minute=0).strftime('%Y-%m-%dT%H:%M')
-            to_local = now.replace(hour=23, minute=59).strftime('%Y-%m-%dT%H:%M')
-
-            url = f"{self.BASE_URL}/flights/airports/iata/{origin}/{from_local}/{to_local}"
-            params = {
-                'direction': 'Departure',
-                'withCancelled': 'true',
-                'withCodeshared': 'false',
-            }
+        Returns:
+            List of flight status dicts, one per distinct flight, in first-seen order
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+        Raises:
+            ValueError: more than MAX_BATCH_FLIGHTS distinct flights were requested
+        """
+        unique = list(dict.fromkeys(_normalize_flight_number(fn) for fn in flight_numbers))
+        if len(unique) > self.MAX_BATCH_FLIGHTS:
+            raise ValueError(f'At most {self.MAX_BATCH_FLIGHTS} flights per request')
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        results = {}
+        misses = []
+        for flight_num in unique:
+            cached = self._cache_get(('flight_status', flight_num, None, today)) if self.api_key else None
+            if cached is not None:
+                results[flight_num] = cached
+            else:
+                misses.append(flight_num)
 
-            if response.status_code != 200:
-                print(f"⚠️ AeroDataBox error ({response.status_code}) — using mock data")
-                return _mock()
-
-            data = response.json()
-            departures = data.get('departures', [])
-
-            # Filter by destination and airline
-            route_flights = []
-            for flight in departures:
-                arr_code = flight.get('arrival', {}).get('airport', {}).get('iata', '')
-                airline = flight.get('airline', {}).get('iata', '')
-                if arr_code == destination and (not airline_code or airline == airline_code):
-                    route_flights.append(self._format_aerodatabox_departure(flight))
-
-            return {
-                'route': f"{origin} → {destination}",
-                'airline': airline_code,
-                'count': len(route_flights),
-                'flights': route_flights,
-                'last_updated': datetime.now().isoformat(),
-                'mock_data': False,
-            }
+        # Misses were already counted above; don't count the re-check again
+        lookups = self._pool.map(partial(self._get_flight_status, count_lookup=False), misses)
+        for flight_num, result in zip(misses, lookups):
+            results[flight_num] = result
 
-        except Exception as e:
-            print(f"⚠️ AeroDataBox exception: {e} — using mock data")
-            return _mock()
+        return [results[flight_num] for flight_num in unique]
 
-    def get_departures(self, airport_code, airline_code=None):
+    def get_route_flights(self, origin, destination, airline_code=None):
         """
-        Get all departing flights from an airport today.
+        Get all flights for a specific route today.
 
-        AeroDataBox endpoint: GET /flights/airports/iata/{code}/{fromLocal}/{toLocal}
+        Uses the origin's departures board, indexed by destination and airline.
         """
-        def _mock():
-            mock_flights = _generate_mock_flights(airport_code, 'departures')
-            return {
-                'airport': airport_code,
-                'airline': airline_code,
-                'type': 'departures',
-                'count': len(mock_flights),
-                'flights': mock_flights,
-                'last_updated': datetime.now().isoformat(),
-                'mock_data': True,
-            }
-
         if not self.api_key:
-            print("⚠️ AeroDataBox API key not configured — using mock data")
-            return _mock()
-
-        try:
-            now = datetime.now()
-            from_local = now.replace(hour=0, minute=0).strftime('%Y-%m-%dT%H:%M')
-            to_local = now.replace(hour=23, minute=59).strftime('%Y-%m-%dT%H:%M')
-
-            url = f"{self.BASE_URL}/flights/airports/iata/{airport_code}/{from_local}/{to_local}"
-            params = {
-                'direction': 'Departure',
-                'withCancelled': 'true',
-                'withCodeshared': 'false',
-            }
-
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-
-            if response.status_code != 200:
-                print(f"⚠️ AeroDataBox error ({response.status_code}) — using mock data")
-                return _mock()
+            log.debug("AeroDataBox API key not configured — using mock data")
+            return self._mock_route(origin, destination, airline_code)
+
+        departures, stale_age = self._get_departures_board(origin)
+        if departures is None:
+            return self._mock_route(origin, destination, airline_code)
+
+        route_flights = departures.index.get((destination, airline_code), [])
+        result = {
+            'route': f"{origin} → {destination}",
+            'airline': airline_code,
+            'count': len(route_flights),
+            'flights': route_flights,
+            'last_updated': datetime.now().isoformat(),
+            'mock_data': False,
+        }
+        if stale_age is not None:
+            result['stale'] = True
+            result['stale_age_s'] = stale_age
+        return result
 
-            data = response.json()
-            departures = data.get('departures', [])
+    def get_departures(self, airport_code, airline_code=None):
+        """
+        Get all departing flights from an airport today.
 
-            # Filter by airline if specified
-            formatted = []
-            for flight in departures:
-                airline = flight.get('airline', {}).get('iata', '')
-                if not airline_code or airline == airline_code:
-                    formatted.append(self._format_aerodatabox_departure(flight))
+        AeroDataBox endpoint: GET /flights/airports/iata/{code}/{fromLocal}/{toLocal}
 
-            # Sort by scheduled time
-            formatted.sort(key=lambda x: x.get('scheduled_time', '') or '')
+        Served from the shared departures board, so filtered and unfiltered
+        views and route lookups for the same airport cost one API call.
+        """
+        if not self.api_key:
+            log.debug("AeroDataBox API key not configured — using mock data")
+            return self._mock_board(airport_code, airline_code, 'departures')
 
-            return {
-                'airport': airport_code,
-                'airline': airline_code,
-                'type': 'departures',
-                'count': len(formatted),
-                'flights': formatted,
-                'last_updated': datetime.now().isoformat(),
-                'mock_data': False,
-            }
+        departures, stale_age = self._get_departures_board(airport_code)
+        if departures is None:
+            return self._mock_board(airport_code, airline_code, 'departures')
 
-        except Exception as e:
-            print(f"⚠️ AeroDataBox exception: {e} — using mock data")
-            return _mock()
+        result = departures.board
+        if airline_code:
+            flights = departures.index.get((None, airline_code), [])
+            result = {**result, 'airline': airline_code, 'count': len(flights), 'flights': flights}
+        if stale_age is not None:
+            result = {**result, 'stale': True, 'stale_age_s': stale_age}
+        return result
 
     def get_arrivals(self, airport_code, airline_code=None):
         """
@@ -412,64 +563,71 @@ class RealTimeFlightService:
 
         AeroDataBox endpoint: GET /flights/airports/iata/{code}/{fromLocal}/{toLocal}
         """
-        def _mock():
-            mock_flights = _generate_mock_flights(airport_code, 'arrivals')
-            return {
-                'airport': airport_code,
-                'airline': airline_code,
-                'type': 'arrivals',
-                'count': len(mock_flights),
-                'flights': mock_flights,
-                'last_updated': datetime.now().isoformat(),
-                'mock_data': True,
-            }
-
         if not self.api_key:
-            print("⚠️ AeroDataBox API key not configured — using mock data")
-            return _mock()
+            log.debug("AeroDataBox API key not configured — using mock data")
+            return self._mock_board(airport_code, airline_code, 'arrivals')
 
-        try:
-            now = datetime.now()
-            from_local = now.replace(hour=0, minute=0).strftime('%Y-%m-%dT%H:%M')
-            to_local = now.replace(hour=23, minute=59).strftime('%Y-%m-%dT%H:%M')
-
-            url = f"{self.BASE_URL}/flights/airports/iata/{airport_code}/{from_local}/{to_local}"
-            params = {
-                'direction': 'Arrival',
-                'withCancelled': 'true',
-                'withCodeshared': 'false',
-            }
+        now = datetime.now()
+        cache_key = ('arrivals', airport_code, airline_code, now.strftime('%Y-%m-%d'))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if self._in_backoff(cache_key):
+            return self._stale_or_mock(cache_key, self._mock_board, airport_code, airline_code, 'arrivals')
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+        try:
+            response = self._fetch_airport_board(airport_code, 'Arrival', now, cache_key)
 
+            if response.status_code == 304:
+                revalidated = self._cache_revalidate(cache_key)
+                if revalidated is not None:
+                    return revalidated
             if response.status_code != 200:
-                print(f"⚠️ AeroDataBox error ({response.status_code}) — using mock data")
-                return _mock()
+                log.warning("AeroDataBox error (%s) — using fallback data", response.status_code)
+                self._start_backoff(cache_key)
+                return self._stale_or_mock(cache_key, self._mock_board, airport_code, airline_code, 'arrivals')
 
-            data = response.json()
+            data = _decode_json(response)
             arrivals = data.get('arrivals', [])
 
             formatted = []
             for flight in arrivals:
-                airline = flight.get('airline', {}).get('iata', '')
-                if not airline_code or airline == airline_code:
-                    formatted.append(self._format_aerodatabox_arrival(flight))
+                airline = flight.get('airline') or {}
+                if airline_code and airline.get('iata', '') != airline_code:
+                    continue
+                dep = flight.get('departure') or {}
+                arr = flight.get('arrival') or {}
+                formatted.append(self._format_aerodatabox_arrival(flight, dep, arr, airline))
 
-            formatted.sort(key=lambda x: x.get('scheduled_time', '') or '')
+            formatted.sort(key=_board_sort_key)
 
-            return {
+            result = {
                 'airport': airport_code,
                 'airline': airline_code,
                 'type': 'arrivals',
                 'count': len(formatted),
                 'flights': formatted,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': now.isoformat(),
                 'mock_data': False,
             }
+            self._cache_put(cache_key, result, self._derive_ttl(formatted), response.headers.get('ETag'))
+            return result
 
         except Exception as e:
-            print(f"⚠️ AeroDataBox exception: {e} — using mock data")
-            return _mock()
+            log.warning("AeroDataBox exception: %s — using fallback data", e)
+            self._start_backoff(cache_key)
+            return self._stale_or_mock(cache_key, self._mock_board, airport_code, airline_code, 'arrivals')
+
+    def get_board(self, airport_code, airline_code=None):
+        """
+        Get departures and arrivals for an airport, fetched concurrently.
+
+        Returns:
+            {'departures': <get_departures result>, 'arrivals': <get_arrivals result>}
+        """
+        departures = self._pool.submit(self.get_departures, airport_code, airline_code)
+        arrivals = self._pool.submit(self.get_arrivals, airport_code, airline_code)
+        return {'departures': departures.result(), 'arrivals': arrivals.result()}
 
     def get_live_flight(self, flight_number):
         """
@@ -485,11 +643,308 @@ class RealTimeFlightService:
             'mock_data': False,
         }
 
+    # -----------------------------------------------------------------
+    # Mock responses (API key missing or API unavailable)
+    # -----------------------------------------------------------------
+
+    def _mock_flight_status(self, flight_num):
+        result = _generate_mock_single_flight(flight_num)
+        result['mock_data'] = True
+        return result
+
+    def _mock_route(self, origin, destination, airline_code):
+        mock_flights = [
+            _generate_mock_single_flight(f"{random.choice(['F9','UA','AA','DL','WN','NK'])}{random.randint(100, 2999)}")
+            for _ in range(random.randint(1, 3))
+        ]
+        return {
+            'route': f"{origin} → {destination}",
+            'airline': airline_code,
+            'count': len(mock_flights),
+            'flights': mock_flights,
+            'last_updated': datetime.now().isoformat(),
+            'mock_data': True,
+        }
+
+    def _mock_board(self, airport_code, airline_code, flight_type):
+        """Mock departures or arrivals board; flight_type is 'departures' or 'arrivals'."""
+        mock_flights = _generate_mock_flights(airport_code, flight_type)
+        return {
+            'airport': airport_code,
+            'airline': airline_code,
+            'type': flight_type,
+            'count': len(mock_flights),
+            'flights': mock_flights,
+            'last_updated': datetime.now().isoformat(),
+            'mock_data': True,
+        }
+
+    # -----------------------------------------------------------------
+    # Airport board fetch + route index
+    # -----------------------------------------------------------------
+
+    def _fetch_airport_board(self, airport_code, direction, now, cache_key):
+        """
+        GET today's departures or arrivals board for an airport.
+
+        AeroDataBox endpoint: GET /flights/airports/iata/{code}/{fromLocal}/{toLocal}
+
+        Args:
+            direction: 'Departure' or 'Arrival'
+            now: datetime used to pick "today"
+            cache_key: cache entry whose ETag (if any) is sent as If-None-Match
+        """
+        from_local = now.replace(hour=0, minute=0).strftime('%Y-%m-%dT%H:%M')
+        to_local = now.replace(hour=23, minute=59).strftime('%Y-%m-%dT%H:%M')
+
+        url = f"{self.BASE_URL}/flights/airports/iata/{airport_code}/{from_local}/{to_local}"
+        params = {
+            'direction': direction,
+            'withCancelled': 'true',
+            'withCodeshared': 'false',
+        }
+
+        with self._request_slots:
+            return self.session.get(url, params=params, headers=self._conditional_headers(cache_key),
+                                    timeout=15)
+
+    def _get_departures_board(self, airport_code):
+        """
+        Today's departures from an airport: the board plus a lookup index.
+
+        One fetch and one cache entry serve get_departures (any airline
+        filter) and get_route_flights. The index maps (arrival_iata,
+        airline_iata), (arrival_iata, None) and (None, airline_iata) to lists
+        of formatted departures in board order, so each lookup is a single
+        dict access.
+
+        Returns:
+            (_DeparturesBoard, stale_age_s) — stale_age_s is None for fresh
+            data; the board is None if the API failed and nothing is cached.
+        """
+        now = datetime.now()
+        cache_key = ('departures', airport_code, None, now.strftime('%Y-%m-%d'))
+        departures = self._cache_get(cache_key)
+        if departures is not None:
+            return departures, None
+
+        if not self._in_backoff(cache_key):
+            try:
+                response = self._fetch_airport_board(airport_code, 'Departure', now, cache_key)
+                if response.status_code == 304:
+                    departures = self._cache_revalidate(cache_key)
+                    if departures is not None:
+                        return departures, None
+                if response.status_code == 200:
+                    formatted_all = []
+                    for flight in _decode_json(response).get('departures', []):
+                        dep = flight.get('departure') or {}
+                        arr = flight.get('arrival') or {}
+                        airline = flight.get('airline') or {}
+                        formatted_all.append(self._format_aerodatabox_departure(flight, dep, arr, airline))
+                    formatted_all.sort(key=_board_sort_key)
+
+                    index = defaultdict(list)
+                    for formatted in formatted_all:
+                        arr_code = formatted['destination']
+                        airline_iata = formatted['airline']['iata']
+                        index[(arr_code, airline_iata)].append(formatted)
+                        index[(arr_code, None)].append(formatted)
+                        index[(None, airline_iata)].append(formatted)
+
+                    departures = _DeparturesBoard(
+                        board={
+                            'airport': airport_code,
+                            'airline': None,
+                            'type': 'departures',
+                            'count': len(formatted_all),
+                            'flights': formatted_all,
+                            'last_updated': now.isoformat(),
+                            'mock_data': False,
+                        },
+                        index=dict(index),
+                    )
+                    self._cache_put(cache_key, departures, self._derive_ttl(formatted_all),
+                                    response.headers.get('ETag'))
+                    return departures, None
+                log.warning("AeroDataBox error (%s) — using fallback data", response.status_code)
+            except Exception as e:
+                log.warning("AeroDataBox exception: %s — using fallback data", e)
+            self._start_backoff(cache_key)
+
+        return self._cache_get_stale(cache_key)
+
+    # -----------------------------------------------------------------
+    # Response cache
+    # -----------------------------------------------------------------
+
+    def _cache_get(self, key, count=True):
+        """
+        Return the cached payload for key if it hasn't expired, else None.
+
+        Pass count=False for a re-check of a lookup already counted in the
+        hit/miss metrics.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None or time.monotonic() >= entry.expires_at:
+                if count:
+                    self._metrics['misses'] += 1
+                return None
+            if count:
+                self._metrics['hits'] += 1
+        return entry.payload
+
+    def _cache_put(self, key, payload, ttl, etag=None):
+        now = time.monotonic()
+        with self._cache_lock:
+            self._cache[key] = _CacheEntry(now + ttl, now, payload, etag)
+            self._metrics['writes'] += 1
+
+    def _conditional_headers(self, key):
+        """If-None-Match header for the cached entry's ETag, or None."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is None or not entry.etag:
+            return None
+        return {'If-None-Match': entry.etag}
+
+    def _cache_revalidate(self, key):
+        """
+        Handle a 304 Not Modified: restart the entry's TTL and return its payload.
+
+        The entry keeps its original TTL length. Returns None if nothing is cached.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            ttl = entry.expires_at - entry.generated_at
+            self._cache[key] = entry._replace(expires_at=now + ttl, generated_at=now)
+            self._metrics['revalidated'] += 1
+        return entry.payload
+
+    def _cache_get_stale(self, key):
+        """Return (payload, age_s) for key ignoring expiry, or (None, None)."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            self._metrics['stale_served' if entry else 'mock_served'] += 1
+        if entry is None:
+            return None, None
+        return entry.payload, round(time.monotonic() - entry.generated_at)
+
+    def _stale_or_mock(self, key, mock, *mock_args):
+        """Serve the last good payload for key (marked stale), else mock(*mock_args)."""
+        payload, age = self._cache_get_stale(key)
+        if payload is None:
+            return mock(*mock_args)
+        return {**payload, 'stale': True, 'stale_age_s': age}
+
+    def _in_backoff(self, key):
+        """True if a recent failure for key means we shouldn't hit the API yet."""
+        with self._cache_lock:
+            if self._neg_cache.get(key, 0) > time.monotonic():
+                self._metrics['neg_hits'] += 1
+                return True
+            return False
+
+    def _start_backoff(self, key):
+        with self._cache_lock:
+            self._neg_cache[key] = time.monotonic() + self.NEGATIVE_TTL
+            self._metrics['neg_writes'] += 1
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.SWEEP_INTERVAL)
+            try:
+                self._sweep()
+            except Exception as e:
+                log.warning("AeroDataBox cache sweep failed: %s", e)
+
+    def _sweep(self):
+        """Evict entries older than STALE_MAX_AGE and lapsed backoffs."""
+        now = time.monotonic()
+        cutoff = now - self.STALE_MAX_AGE
+        with self._cache_lock:
+            old_keys = [k for k, entry in self._cache.items() if entry.generated_at < cutoff]
+            for key in old_keys:
+                del self._cache[key]
+            for key in [k for k, until in self._neg_cache.items() if until <= now]:
+                del self._neg_cache[key]
+            self._metrics['evicted'] += len(old_keys)
+
+    def get_cache_stats(self):
+        """
+        Cache counters since startup, for tuning the TTLs against quota usage.
+
+        hits/misses/writes — fresh-cache lookups and stores
+        revalidated        — expired entries refreshed by a 304 Not Modified
+        neg_hits/neg_writes — API calls skipped during / backoffs started after failures
+        stale_served/mock_served — fallbacks used when the API was unavailable
+        evicted            — entries dropped by the background sweep
+        """
+        with self._cache_lock:
+            stats = dict(self._metrics)
+            stats['entries'] = len(self._cache)
+        return stats
+
+    def _derive_ttl(self, flights):
+        """
+        Pick a cache TTL (seconds) for a board of formatted flights.
+
+        Each flight gets a TTL from its status; the board takes the max across
+        the list so one imminent departure doesn't collapse the TTL for the
+        whole board, capped at TTL_DEFAULT so one far-off or finished flight
+        can't freeze the live flights on it for hours.
+        """
+        if not flights:
+            return self.TTL_DEFAULT
+        now = datetime.now(timezone.utc)
+        return min(self.TTL_DEFAULT, max(self._flight_ttl(f, now) for f in flights))
+
+    def _flight_ttl(self, flight, now):
+        status = flight.get('status')
+        if status in ('landed', 'cancelled', 'diverted'):
+            return self.TTL_FINISHED
+
+        if status == 'active':
+            arrival = flight.get('arrival') or {}
+            eta = arrival.get('estimated') or arrival.get('scheduled')
+            seconds = self._seconds_until(eta, now)
+            if seconds is None:
+                return self.TTL_DEFAULT
+            return max(self.TTL_MIN, seconds + self.TTL_ETA_PADDING)
+
+        if status in ('scheduled', 'delayed'):
+            departure = flight.get('departure') or {}
+            # Board items carry the scheduled time at the top level
+            scheduled = departure.get('scheduled') or flight.get('scheduled')
+            seconds = self._seconds_until(scheduled, now)
+            if seconds is None:
+                return self.TTL_DEFAULT
+            return max(self.TTL_MIN, min(self.TTL_SCHEDULED_MAX, seconds))
+
+        return self.TTL_DEFAULT
+
+    @staticmethod
+    def _seconds_until(parsed_time, now):
+        """Seconds from `now` (aware, UTC) until a `_parse_time` result, or None if unknown."""
+        if not parsed_time or not parsed_time.get('iso'):
+            return None
+        try:
+            dt = datetime.fromisoformat(parsed_time['iso'].replace(' ', 'T'))
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.astimezone()  # naive times are treated as server-local
+        return (dt - now).total_seconds()
+
     # -----------------------------------------------------------------
     # Response format converters
     # -----------------------------------------------------------------
 
-    def _format_aerodatabox_flight(self, flight_data, flight_number=None):
+    def _format_aerodatabox_flight(self, flight_data, flight_number, flight_date):
         """
         Format AeroDataBox single-flight response to app format.
 
@@ -502,17 +957,18 @@ class RealTimeFlightService:
             "aircraft": {"model": "Airbus A320"}
         }
         """
-        dep = flight_data.get('departure', {})
-        arr = flight_data.get('arrival', {})
-        dep_airport = dep.get('airport', {})
-        arr_airport = arr.get('airport', {})
+        dep = flight_data.get('departure') or {}
+        arr = flight_data.get('arrival') or {}
+        dep_airport = dep.get('airport') or {}
+        arr_airport = arr.get('airport') or {}
+        airline = flight_data.get('airline') or {}
 
         # Flight number
         fn = flight_data.get('number', flight_number or 'N/A').replace(' ', '')
 
         # Status mapping
         raw_status = (flight_data.get('status', 'Unknown') or 'Unknown').lower()
-        status = self._map_status(raw_status)
+        status = _map_status(raw_status)
 
         # Times
         dep_scheduled = self._parse_time(dep.get('scheduledTimeLocal'))
@@ -530,8 +986,8 @@ class RealTimeFlightService:
             'flight_number': fn,
             'flight_icao': flight_data.get('callSign'),
             'airline': {
-                'name': flight_data.get('airline', {}).get('name', 'Unknown Airline'),
-                'iata': flight_data.get('airline', {}).get('iata', ''),
+                'name': airline.get('name', 'Unknown Airline'),
+                'iata': airline.get('iata', ''),
             },
             'status': status,
             'status_display': _get_status_display(status),
@@ -544,7 +1000,7 @@ class RealTimeFlightService:
                 'estimated': self._parse_time(dep.get('estimatedTimeLocal')),
                 'actual': self._parse_time(dep.get('actualTimeLocal')),
                 'delay_minutes': dep_delay if dep_delay else None,
-                'delay_display': f"+{dep_delay} min" if dep_delay and dep_delay > 0 else None,
+                'delay_display': _format_delay(dep_delay),
             },
             'arrival': {
                 'airport': arr_airport.get('name', arr_airport.get('iata', 'N/A')),
@@ -559,19 +1015,22 @@ class RealTimeFlightService:
                 'delay_display': None,
             },
             'live': None,  # AeroDataBox doesn't provide live ADS-B tracking on free tier
-            'flight_date': datetime.now().strftime('%Y-%m-%d'),
+            'flight_date': flight_date,
         }
 
-    def _format_aerodatabox_departure(self, flight_data):
-        """Format an AeroDataBox departures-list item for the flight board."""
-        dep = flight_data.get('departure', {})
-        arr = flight_data.get('arrival', {})
-        dep_airport = dep.get('airport', {})
-        arr_airport = arr.get('airport', {})
+    def _format_aerodatabox_departure(self, flight_data, dep, arr, airline):
+        """
+        Format an AeroDataBox departures-list item for the flight board.
+
+        dep, arr and airline are the item's sub-dicts, already extracted by the
+        caller's filter loop.
+        """
+        dep_airport = dep.get('airport') or {}
+        arr_airport = arr.get('airport') or {}
 
         fn = (flight_data.get('number', 'N/A') or 'N/A').replace(' ', '')
         raw_status = (flight_data.get('status', 'Unknown') or 'Unknown').lower()
-        status = self._map_status(raw_status)
+        status = _map_status(raw_status)
 
         dep_scheduled = self._parse_time(dep.get('scheduledTimeLocal'))
         dep_actual = self._parse_time(dep.get('actualTimeLocal'))
@@ -583,8 +1042,8 @@ class RealTimeFlightService:
         return {
             'flight_number': fn,
             'airline': {
-                'name': flight_data.get('airline', {}).get('name', ''),
-                'iata': flight_data.get('airline', {}).get('iata', ''),
+                'name': airline.get('name', ''),
+                'iata': airline.get('iata', ''),
             },
             'origin': dep_airport.get('iata', 'N/A'),
             'origin_city': dep_airport.get('name', dep_airport.get('iata', '')),
@@ -595,22 +1054,25 @@ class RealTimeFlightService:
             'scheduled_time': dep_scheduled.get('time', '') if dep_scheduled else '',
             'scheduled': dep_scheduled,
             'actual': dep_actual,
-            'delay': f"+{dep_delay} min" if dep_delay and dep_delay > 0 else 'On time',
+            'delay': _format_delay(dep_delay) or 'On time',
             'terminal': dep.get('terminal'),
             'gate': dep.get('gate'),
-            'aircraft': (flight_data.get('aircraft', {}) or {}).get('model', 'N/A'),
+            'aircraft': (flight_data.get('aircraft') or {}).get('model', 'N/A'),
         }
 
-    def _format_aerodatabox_arrival(self, flight_data):
-        """Format an AeroDataBox arrivals-list item for the flight board."""
-        dep = flight_data.get('departure', {})
-        arr = flight_data.get('arrival', {})
-        dep_airport = dep.get('airport', {})
-        arr_airport = arr.get('airport', {})
+    def _format_aerodatabox_arrival(self, flight_data, dep, arr, airline):
+        """
+        Format an AeroDataBox arrivals-list item for the flight board.
+
+        dep, arr and airline are the item's sub-dicts, already extracted by the
+        caller's filter loop.
+        """
+        dep_airport = dep.get('airport') or {}
+        arr_airport = arr.get('airport') or {}
 
         fn = (flight_data.get('number', 'N/A') or 'N/A').replace(' ', '')
         raw_status = (flight_data.get('status', 'Unknown') or 'Unknown').lower()
-        status = self._map_status(raw_status)
+        status = _map_status(raw_status)
 
         arr_scheduled = self._parse_time(arr.get('scheduledTimeLocal'))
         arr_actual = self._parse_time(arr.get('actualTimeLocal'))
@@ -618,8 +1080,8 @@ class RealTimeFlightService:
         return {
             'flight_number': fn,
             'airline': {
-                'name': flight_data.get('airline', {}).get('name', ''),
-                'iata': flight_data.get('airline', {}).get('iata', ''),
+                'name': airline.get('name', ''),
+                'iata': airline.get('iata', ''),
             },
             'origin': dep_airport.get('iata', 'N/A'),
             'origin_city': dep_airport.get('name', dep_airport.get('iata', '')),
@@ -633,7 +1095,7 @@ class RealTimeFlightService:
             'delay': 'On time',
             'terminal': arr.get('terminal'),
             'gate': arr.get('gate'),
-            'aircraft': (flight_data.get('aircraft', {}) or {}).get('model', 'N/A'),
+            'aircraft': (flight_data.get('aircraft') or {}).get('model', 'N/A'),
         }
 
     # -----------------------------------------------------------------
@@ -644,60 +1106,13 @@ class RealTimeFlightService:
         """Parse AeroDataBox local time string (ISO 8601) to app format."""
         if not time_str:
             return None
-        try:
-            # AeroDataBox format: "2026-02-23 14:30+01:00" or "2026-02-23T14:30:00"
-            clean = time_str.replace(' ', 'T')
-            # Handle timezone offset
-            if '+' in clean and 'T' in clean:
-                dt_part = clean.split('+')[0]
-            elif clean.endswith('Z'):
-                dt_part = clean[:-1]
-            else:
-                dt_part = clean
-
-            dt = datetime.fromisoformat(dt_part)
-            return {
-                'iso': time_str,
-                'time': dt.strftime('%I:%M %p'),
-                'date': dt.strftime('%Y-%m-%d'),
-                'full': dt.strftime('%b %d, %I:%M %p'),
-            }
-        except (ValueError, TypeError):
-            return {'iso': time_str, 'time': time_str, 'date': None, 'full': time_str}
-
-    def _map_status(self, raw_status):
-        """Map AeroDataBox status strings to our standard status codes."""
-        raw = raw_status.lower().strip()
-        mapping = {
-            'scheduled': 'scheduled',
-            'expected': 'scheduled',
-            'departed': 'active',
-            'en route': 'active',
-            'airborne': 'active',
-            'approaching': 'active',
-            'arrived': 'landed',
-            'landed': 'landed',
-            'cancelled': 'cancelled',
-            'canceled': 'cancelled',
-            'diverted': 'diverted',
-            'delayed': 'delayed',
-            'unknown': 'unknown',
-        }
-        return mapping.get(raw, 'unknown')
+        return _parse_local_time(time_str)
 
     def _parse_iso_duration_minutes(self, duration_str):
         """Parse ISO 8601 duration like 'PT15M' to minutes."""
         if not duration_str or not isinstance(duration_str, str):
             return 0
-        try:
-            duration_str = duration_str.upper().replace('PT', '')
-            minutes = 0
-            if 'H' in duration_str:
-                parts = duration_str.split('H')
-                minutes += int(parts[0]) * 60
-                duration_str = parts[1] if len(parts) > 1 else ''
-            if 'M' in duration_str:
-                minutes += int(duration_str.replace('M', ''))
-            return minutes
-        except (ValueError, IndexError):
+        match = _ISO_DURATION_RE.match(duration_str)
+        if not match:
             return 0
+        return int(match[1] or 0) * 60 + int(match[2] or 0)
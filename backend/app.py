@@ -1,21 +1,40 @@
 from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_caching import Cache
 from serpapi_flights import SerpApiFlightSearch
 from aerodatabox_api import RealTimeFlightService
 from trip_planner import find_optimal_trips
 from gowild_blackout import GoWildBlackoutDates
-from blackout_updater import update_if_needed, get_blackout_data
-from datetime import datetime, timedelta
+from blackout_updater import (update_if_needed, get_blackout_data, fetch_blackout_dates,
+                              CACHE_FILE as BLACKOUT_CACHE_FILE)
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
+import atexit
+import gzip
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import random
+import re
 import time
 import threading
-import urllib.request
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import traceback
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster JSON for jsonify, the streams and the search cache
+except ImportError:
+    orjson = None
 
 
 # Auth imports
@@ -24,6 +43,8 @@ from google.auth.transport import requests as google_requests
 import jwt as pyjwt
 import hashlib
 from functools import wraps
+from itertools import groupby
+from operator import itemgetter
 
 # Load environment variables from .env file
 load_dotenv()
@@ -57,12 +78,52 @@ def require_auth(f):
         return f(*args, **kwargs)
     return decorated
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (jsonify + request.get_json)."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        # The inherited response() asks for indent=2 in debug mode
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for React frontend
 
+# Per-request chatter goes through this logger at DEBUG so it costs nothing
+# unless LOG_LEVEL=DEBUG; errors still surface at the default INFO level.
+# Request threads only enqueue records; one listener thread does the writes,
+# so a slow stderr never blocks a request. The API clients log to children
+# of this logger (wildpass.serpapi, wildpass.aerodatabox).
+log = logging.getLogger('wildpass')
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+    _log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    # getLevelName maps known names to ints; anything else falls back to INFO
+    _log_level = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    log.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
+    log.propagate = False
+
 # =============================================================================
 # KEEP-ALIVE SELF-PING (prevents Render free-tier from sleeping after 15 min)
 # =============================================================================
+PING_INTERVAL = 300  # 5 minutes
+_ping_stop = threading.Event()
+atexit.register(_ping_stop.set)
+
+
 def _keep_alive_ping():
     """Background thread that pings the public Render URL every 5 minutes.
     Uses the external URL so Render counts it as real inbound traffic."""
@@ -71,31 +132,137 @@ def _keep_alive_ping():
         print("⏸️  RENDER_EXTERNAL_URL not set — keep-alive self-ping disabled (local dev)")
         return
     health_url = f"{public_url}/health"
+    # Reuse one pooled connection across pings when the edge keeps it open;
+    # a stale socket is retried on a fresh connection
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                          max_retries=Retry(total=2, backoff_factor=0.3)))
     print(f"💓 Keep-alive thread started — pinging {health_url} every 5 min")
-    while True:
-        time.sleep(300)  # 5 minutes
+    # Fixed cadence measured on the monotonic clock, so a slow ping doesn't
+    # push later ones back; the event wakes the wait immediately on shutdown
+    next_ping = time.monotonic() + PING_INTERVAL
+    while not _ping_stop.wait(max(0, next_ping - time.monotonic())):
         try:
-            req = urllib.request.Request(health_url, method='GET')
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                print(f"💓 Keep-alive ping: {resp.status}")
+            resp = session.get(health_url, timeout=10)
+            log.debug("Keep-alive ping: %s", resp.status_code)
         except Exception as e:
-            print(f"💓 Keep-alive ping failed: {e}")
+            log.warning("Keep-alive ping failed: %s", e)
+        next_ping = max(next_ping + PING_INTERVAL, time.monotonic())
 
 # Start the keep-alive thread (daemon so it dies with the process)
 _ping_thread = threading.Thread(target=_keep_alive_ping, daemon=True)
 _ping_thread.start()
 
-# File-based cache that survives restarts
-cache_config = {
-    'CACHE_TYPE': 'FileSystemCache',
-    'CACHE_DIR': os.path.join(os.path.dirname(os.path.abspath(__file__)), '.flask_cache'),
-    'CACHE_DEFAULT_TIMEOUT': 3600,  # 1 hour
-}
+# Search cache: Redis when REDIS_URL is set (shared across workers and hosts,
+# requires the `redis` package; `redis[hiredis]` adds the C reply parser), otherwise a file-based cache that survives
+# restarts and is shared by workers on the same machine
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    cache_config = {
+        'CACHE_TYPE': 'RedisCache',
+        'CACHE_REDIS_URL': REDIS_URL,
+        'CACHE_KEY_PREFIX': 'wildpass:',
+        'CACHE_DEFAULT_TIMEOUT': 3600,  # 1 hour
+    }
+else:
+    cache_config = {
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': os.path.join(os.path.dirname(os.path.abspath(__file__)), '.flask_cache'),
+        'CACHE_DEFAULT_TIMEOUT': 3600,  # 1 hour
+        'CACHE_THRESHOLD': 1024,  # max entries before oldest/expired files are pruned
+    }
 app.config.from_mapping(cache_config)
 flask_cache = Cache(app)
 
+class LocalTTLCache:
+    """Bounded in-process LRU with per-entry expiry that stores references.
+
+    Unlike cachelib's SimpleCache nothing is pickled: get() hands back the
+    stored object itself, so callers must treat values as read-only.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at monotonic, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Small per-process front for the shared cache so hot repeat searches skip the
+# file/Redis read and the unpickle. /api/cache/clear only empties this
+# worker's copy, so the short TTL bounds how long other workers serve results
+# from before a clear.
+search_l1 = LocalTTLCache(maxsize=256, ttl=60)
+
+
+def search_cache_get(key):
+    result = search_l1.get(key)
+    if result is None:
+        result = flask_cache.get(key)
+        if isinstance(result, bytes):
+            result = (orjson.loads if orjson else json.loads)(result)
+        if result is not None:
+            search_l1.set(key, result)
+    return result
+
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def coalesced(key, fn, *args):
+    """Run fn(*args) once per key at a time; concurrent callers share the outcome."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        result = fn(*args)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def search_cache_set(key, flights):
+    search_l1.set(key, flights)
+    # The shared tier pickles whatever it is given; a flat orjson blob is
+    # cheaper to pickle and unpickle than a list of flight dicts
+    flask_cache.set(key, orjson.dumps(flights) if orjson else flights)
+
 # Lazy initialization flag
-_startup_done = False
+_startup_done = threading.Event()
 _startup_lock = threading.Lock()
 
 # Root route for health checks (Render, etc.)
@@ -112,22 +279,93 @@ def index():
 def health():
     return jsonify({'status': 'ok'})
 
+def _warm_up():
+    """Startup work kept off the request path: refresh blackouts, then prime caches."""
+    try:
+        update_if_needed()
+    except Exception as e:
+        log.warning("Blackout update failed: %s", e)
+    try:
+        GoWildBlackoutDates.get_all_blackout_periods()
+        _blackout_body()
+    except Exception as e:
+        log.warning("Cache warm-up failed: %s", e)
+
 def _lazy_init():
     """Run startup tasks lazily on first request (in a background thread)."""
-    global _startup_done
-    if _startup_done:
+    if _startup_done.is_set():
         return
     with _startup_lock:
-        if _startup_done:
+        if _startup_done.is_set():
             return
-        _startup_done = True
-        threading.Thread(target=update_if_needed, daemon=True).start()
-        print("🚀 WildPass Backend ready (blackout update running in background)")
+        threading.Thread(target=_warm_up, daemon=True).start()
+        # Only mark done once the warm-up thread is actually running
+        _startup_done.set()
+        # Flask 3 has no before_first_request; unhook ourselves instead. The
+        # list is rebound, not mutated, so requests iterating it are unaffected.
+        funcs = app.before_request_funcs.get(None, [])
+        app.before_request_funcs[None] = [f for f in funcs if f is not ensure_initialized]
+        print("🚀 WildPass Backend ready (blackout update and warm-up running in background)")
 
 @app.before_request
 def ensure_initialized():
     _lazy_init()
 
+# Search responses are hundreds of KB of repetitive JSON; gzip them for clients
+# that accept it. Tiny bodies are left as-is; streams go through stream_response.
+GZIP_MIN_BYTES = 1024
+
+def _is_buffered_json(response):
+    return (response.status_code == 200
+            and response.mimetype == 'application/json'
+            and not response.is_streamed
+            and not response.direct_passthrough)
+
+def conditional_response(response):
+    """ETag GET JSON bodies so repeat polls (realtime boards etc.) can get a 304."""
+    if request.method != 'GET' or not _is_buffered_json(response):
+        return response
+    if 'ETag' not in response.headers:
+        response.add_etag()
+    return response.make_conditional(request)
+
+def gzip_response(response):
+    if (not _is_buffered_json(response)
+            or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=5))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    # The gzipped bytes are a different representation of the same content
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+def _gzip_chunks(chunks):
+    """Gzip a byte stream, sync-flushing after each chunk so no event is held back."""
+    compressor = zlib.compressobj(5, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+def stream_response(chunks, mimetype, headers):
+    """Streamed Response for a byte generator, gzipped per chunk when accepted."""
+    headers = {**headers, 'X-Accel-Buffering': 'no'}
+    if request.accept_encodings['gzip']:
+        chunks = _gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+@app.after_request
+def finalize_response(response):
+    return gzip_response(conditional_response(response))
+
 # Initialize SerpApi Google Flights client (flight search — includes Frontier F9)
 flight_client = None
 FLIGHT_API_ENABLED = False
@@ -139,15 +377,38 @@ try:
 except ValueError as e:
     print(f"Warning: SerpApi not configured: {e}")
 
+# Shared pool for fanning out upstream flight searches (reused across requests
+# instead of spinning up threads per request)
+search_executor = ThreadPoolExecutor(max_workers=8)
+
+# Trip planner: how many departure days past the current one to search
+# speculatively. Each day costs 5 searches per route of SerpApi quota even when
+# an earlier day matches, so this is off by default.
+try:
+    TRIP_PLANNER_LOOKAHEAD = max(0, int(os.environ.get('TRIP_PLANNER_LOOKAHEAD', '0')))
+except ValueError:
+    log.warning("Ignoring invalid TRIP_PLANNER_LOOKAHEAD=%r; lookahead disabled",
+                os.environ.get('TRIP_PLANNER_LOOKAHEAD'))
+    TRIP_PLANNER_LOOKAHEAD = 0
+
 # Initialize Real-Time Flight Service (AeroDataBox via RapidAPI)
 realtime_service = RealTimeFlightService()
+# The API key is read once at construction, so this can't change at runtime
+REALTIME_CONFIGURED = realtime_service.is_configured()
 
 # Development mode — returns mock data when API keys are not configured
 DEV_MODE = os.environ.get('DEV_MODE', 'false' if FLIGHT_API_ENABLED else 'true').lower() == 'true'
 
 def get_cache_key(origins, destinations, departure_date, return_date, trip_type, airline_filter='F9'):
-    """Generate a unique cache key for the search parameters"""
-    return f"flights_{','.join(sorted(origins))}_{','.join(sorted(destinations))}_{departure_date}_{return_date}_{trip_type}_{airline_filter or 'ALL'}"
+    """Generate a unique cache key for the search parameters.
+
+    Must stay a str: FileSystemCache hashes the key into a filename, so tuple
+    keys are not supported by the backing store. Multi-airport searches make
+    the canonical form long, so it is digested to a fixed 32-char key.
+    """
+    # Order- and duplicate-insensitive, like a frozenset of codes
+    canonical = f"{','.join(sorted(set(origins)))}_{','.join(sorted(set(destinations)))}_{departure_date}_{return_date}_{trip_type}_{airline_filter or 'ALL'}"
+    return 'flights_' + hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -157,7 +418,7 @@ def health_check():
         'message': 'Flight Search API is running',
         'flight_api_enabled': FLIGHT_API_ENABLED,
         'dev_mode': DEV_MODE,
-        'realtime_service_enabled': realtime_service.is_configured(),
+        'realtime_service_enabled': REALTIME_CONFIGURED,
         'note': 'Flight search: SerpApi Google Flights | Real-time status: AeroDataBox'
     })
 
@@ -195,56 +456,207 @@ def api_test():
         })
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'status': 'error',
-            'message': str(e),
-            'traceback': traceback.format_exc()
-        }), 500
+        log.exception("SerpApi connection test failed")
+        error = {'status': 'error', 'message': str(e)}
+        if app.debug:
+            error['traceback'] = traceback.format_exc()
+        return jsonify(error), 500
+
+_MOCK_MINUTES = ('00', '15', '30', '45')
+_MOCK_MINUTES_INT = (0, 15, 30, 45)
+
 
 def generate_mock_flights(origins, destinations, departure_date, return_date=None):
     """Generate mock flight data for development/testing (snake_case format)"""
     flights = []
 
-    dest_list = destinations if destinations != ['ANY'] else ['MCO', 'LAS', 'MIA', 'PHX', 'ATL']
+    # Slice once here; inside the comprehension it would be rebuilt per origin
+    dest_list = (destinations if destinations != ['ANY'] else ['MCO', 'LAS', 'MIA', 'PHX', 'ATL'])[:5]
     blackout_info = GoWildBlackoutDates.is_flight_affected_by_blackout(departure_date, return_date)
 
-    for origin in origins:
-        for destination in dest_list[:5]:
-            if origin == destination:
-                continue
-
-            for _ in range(random.randint(1, 2)):
-                hour = random.randint(6, 20)
-                minute = random.choice(['00', '15', '30', '45'])
-                departure_time = f"{hour:02d}:{minute} {'AM' if hour < 12 else 'PM'}"
-                duration_hours = random.randint(2, 6)
-                duration_mins = random.choice([0, 15, 30, 45])
-
-                flight = {
-                    'origin': origin,
-                    'destination': destination,
-                    'departure_date': departure_date,
-                    'departure_time': departure_time,
-                    'arrival_date': departure_date,
-                    'arrival_time': f"{(hour + duration_hours) % 24:02d}:{duration_mins:02d} {'AM' if (hour + duration_hours) < 12 else 'PM'}",
-                    'duration': f"{duration_hours}h {duration_mins}m",
-                    'stops': random.choice([0, 0, 0, 1]),
-                    'price': round(random.uniform(29, 199), 2),
-                    'currency': 'USD',
-                    'seats_remaining': random.randint(1, 15),
-                    'airline': 'Frontier Airlines',
-                    'flight_number': f"F9{random.randint(1000, 9999)}",
-                    'aircraft': random.choice(['A320', 'A321', 'A319']),
-                    'is_round_trip': False,
-                    'gowild_eligible': random.choice([True, True, False]),
-                    'blackout_dates': blackout_info
-                }
-                flights.append(flight)
+    routes = [(origin, destination)
+              for origin in origins
+              for destination in dest_list
+              if origin != destination]
+
+    # One or two flights per route; draw every random field for the batch up front
+    legs = [route for route, count in zip(routes, random.choices((1, 2), k=len(routes)))
+            for _ in range(count)]
+    n = len(legs)
+    # The three 4-way fields (departure minute, duration minutes, stops) come
+    # from one getrandbits call: 6 bits per flight, 2 bits per field, unbiased
+    bits = random.getrandbits(6 * n) if n else 0
+    quads = [(bits >> (6 * i)) & 0x3F for i in range(n)]
+    draws = zip(
+        legs,
+        random.choices(range(6, 21), k=n),
+        [_MOCK_MINUTES[q & 3] for q in quads],
+        random.choices(range(2, 7), k=n),
+        [_MOCK_MINUTES_INT[(q >> 2) & 3] for q in quads],
+        [1 if (q >> 4) == 3 else 0 for q in quads],  # one in four has a stop
+        random.choices(range(2900, 19901), k=n),  # price in cents
+        random.choices(range(1, 16), k=n),
+        random.choices(range(1000, 10000), k=n),
+        random.choices(('A320', 'A321', 'A319'), k=n),
+        random.choices((True, True, False), k=n),
+    )
+
+    for ((origin, destination), hour, minute, duration_hours, duration_mins, stops,
+            price_cents, seats, number, aircraft, gowild) in draws:
+        arrival_hour = hour + duration_hours
+        flights.append({
+            'origin': origin,
+            'destination': destination,
+            'departure_date': departure_date,
+            'departure_time': f"{hour:02d}:{minute} {'AM' if hour < 12 else 'PM'}",
+            'arrival_date': departure_date,
+            'arrival_time': f"{arrival_hour % 24:02d}:{duration_mins:02d} {'AM' if arrival_hour < 12 else 'PM'}",
+            'duration': f"{duration_hours}h {duration_mins}m",
+            'stops': stops,
+            'price': price_cents / 100,
+            'currency': 'USD',
+            'seats_remaining': seats,
+            'airline': 'Frontier Airlines',
+            'flight_number': f"F9{number}",
+            'aircraft': aircraft,
+            'is_round_trip': False,
+            'gowild_eligible': gowild,
+            'blackout_dates': blackout_info
+        })
 
     return flights
 
 
+def sse_event(data):
+    """Encode one Server-Sent Events message as bytes."""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(data) + b"\n\n"
+    return f"data: {json.dumps(data)}\n\n".encode()
+
+
+def ndjson_line(data):
+    """Encode one newline-delimited JSON record as bytes."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data) + "\n").encode()
+
+
+_IATA_CODE_RE = re.compile(r'[A-Z]{3}')
+
+
+def _normalize_codes(value):
+    """Uppercased IATA codes (or ['ANY']), or None if value isn't a list of them."""
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        return None
+    codes = [v.strip().upper() for v in value]
+    if codes == ['ANY'] or all(_IATA_CODE_RE.fullmatch(c) for c in codes):
+        return codes
+    return None
+
+
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+
+def _is_iso_date(value):
+    """True for a real calendar date written exactly as YYYY-MM-DD."""
+    # fromisoformat alone also takes week dates like 2026-W49-2
+    if not isinstance(value, str) or not _ISO_DATE_RE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_search_request():
+    """
+    Read and validate the JSON body shared by the search endpoints.
+
+    Returns (params, None) on success or (None, error_response) with a 400.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return None, (jsonify({'error': 'Request body must be a JSON object'}), 400)
+
+    origins = data.get('origins', [])
+    destinations = data.get('destinations', [])
+    departure_date = data.get('departureDate')
+    return_date = data.get('returnDate') or None
+
+    if not origins or not destinations or not departure_date:
+        return None, (jsonify({
+            'error': 'Missing required fields: origins, destinations, departureDate'
+        }), 400)
+
+    # Reject malformed input here rather than spending SerpApi quota on it
+    origins = _normalize_codes(origins)
+    destinations = _normalize_codes(destinations)
+    if origins is None or destinations is None or origins == ['ANY']:
+        return None, (jsonify({
+            'error': 'origins and destinations must be lists of 3-letter airport codes'
+        }), 400)
+    if not _is_iso_date(departure_date) or (return_date is not None and not _is_iso_date(return_date)):
+        return None, (jsonify({
+            'error': 'departureDate and returnDate must be YYYY-MM-DD dates'
+        }), 400)
+
+    # Airline filter: 'F9' (default), 'ALL' or '' means no filter
+    raw_airline = data.get('airlineFilter', 'F9')
+    airline_filter = None if raw_airline in ('ALL', '') else (raw_airline or 'F9')
+
+    return {
+        'data': data,
+        'origins': origins,
+        'destinations': destinations,
+        'trip_type': data.get('tripType', 'round-trip'),
+        'departure_date': departure_date,
+        'return_date': return_date,
+        'nonstop_only': bool(data.get('nonstopOnly', False)),
+        'airline_filter': airline_filter,
+        # Dev-only: pace mock streams so progressive rendering can be eyeballed
+        'simulate_delay': bool(data.get('simulateDelay', False)) and search_impl is _search_mock,
+    }, None
+
+
+def _search_serpapi(origins, destinations, departure_date, return_date, trip_type, airline_filter):
+    """Search SerpApi Google Flights; retry across all airlines if the filter finds nothing."""
+    log.debug("[SERPAPI] Searching flights for %s -> %s", origins, destinations)
+    search_return = return_date if trip_type == 'round-trip' else None
+    flights = flight_client.search_flights(
+        origins=origins,
+        destinations=destinations,
+        departure_date=departure_date,
+        return_date=search_return,
+        adults=1,
+        airline_filter=airline_filter
+    )
+    if flights:
+        return flights, 'serpapi'
+
+    # If no Frontier flights, try without airline filter
+    log.debug("[SERPAPI] No F9 flights found, searching all airlines...")
+    flights = flight_client.search_flights(
+        origins=origins,
+        destinations=destinations,
+        departure_date=departure_date,
+        return_date=search_return,
+        adults=1,
+        airline_filter=None
+    )
+    return flights, 'serpapi_all_airlines'
+
+
+def _search_mock(origins, destinations, departure_date, return_date, trip_type, airline_filter):
+    """Mock search used when SerpApi is not configured."""
+    log.debug("[MOCK DATA] Generating flights for %s -> %s", origins, destinations)
+    return generate_mock_flights(origins, destinations, departure_date, return_date), 'mock'
+
+
+# Configuration is fixed at startup, so pick the /api/search backend once
+search_impl = _search_serpapi if FLIGHT_API_ENABLED and flight_client else _search_mock
+
+
 @app.route('/api/auth/google', methods=['POST'])
 def auth_google():
     """Verify Google OAuth token and return session JWT"""
@@ -297,28 +709,21 @@ def search_flights():
     }
     """
     try:
-        data = request.get_json()
-
-        origins = data.get('origins', [])
-        destinations = data.get('destinations', [])
-        trip_type = data.get('tripType', 'round-trip')
-        departure_date = data.get('departureDate')
-        return_date = data.get('returnDate')
-        nonstop_only = bool(data.get('nonstopOnly', False))
-
-        # Airline filter: 'F9' (default), 'ALL' or '' means no filter
-        raw_airline = data.get('airlineFilter', 'F9')
-        airline_filter = None if raw_airline in ('ALL', '') else (raw_airline or 'F9')
-
-        # Validate required fields
-        if not origins or not destinations or not departure_date:
-            return jsonify({
-                'error': 'Missing required fields: origins, destinations, departureDate'
-            }), 400
+        params, error = parse_search_request()
+        if error:
+            return error
+        data = params['data']
+        origins = params['origins']
+        destinations = params['destinations']
+        trip_type = params['trip_type']
+        departure_date = params['departure_date']
+        return_date = params['return_date']
+        nonstop_only = params['nonstop_only']
+        airline_filter = params['airline_filter']
 
         # Check cache first (cache stores UNFILTERED results; nonstop filter applied on read)
         cache_key = get_cache_key(origins, destinations, departure_date, return_date, trip_type, airline_filter)
-        cached_result = flask_cache.get(cache_key)
+        cached_result = search_cache_get(cache_key)
 
         def _apply_nonstop(flts):
             if nonstop_only and flts:
@@ -326,7 +731,7 @@ def search_flights():
             return flts
 
         if cached_result is not None:
-            print(f"Returning cached results for {cache_key}")
+            log.debug("Returning cached results for %s", cache_key)
             return jsonify({
                 'flights': _apply_nonstop(cached_result),
                 'cached': True,
@@ -334,42 +739,23 @@ def search_flights():
                 'devMode': DEV_MODE
             })
 
-        # Use SerpApi Google Flights if configured, otherwise fall back to mock data
-        if FLIGHT_API_ENABLED and flight_client:
-            print(f"[SERPAPI] Searching flights for {origins} -> {destinations}")
-            flights = flight_client.search_flights(
-                origins=origins,
-                destinations=destinations,
-                departure_date=departure_date,
-                return_date=return_date if trip_type == 'round-trip' else None,
-                adults=1,
-                airline_filter=airline_filter
-            )
-            data_source = 'serpapi'
-
-            # If no Frontier flights, try without airline filter
-            if not flights:
-                print(f"[SERPAPI] No F9 flights found, searching all airlines...")
-                flights = flight_client.search_flights(
-                    origins=origins,
-                    destinations=destinations,
-                    departure_date=departure_date,
-                    return_date=return_date if trip_type == 'round-trip' else None,
-                    adults=1,
-                    airline_filter=None
-                )
-                data_source = 'serpapi_all_airlines'
-        else:
-            print(f"[MOCK DATA] Generating flights for {origins} -> {destinations}")
-            flights = generate_mock_flights(origins, destinations, departure_date, return_date)
-            data_source = 'mock'
+        def _search_and_cache():
+            found, source = search_impl(origins, destinations, departure_date, return_date,
+                                        trip_type, airline_filter)
+            # Cache the UNFILTERED results before the in-flight entry is dropped,
+            # so a request arriving right after finds them in the cache
+            search_cache_set(cache_key, found)
+            return found, source
 
-        # Cache the UNFILTERED results, then apply nonstop filter to response
-        flask_cache.set(cache_key, flights)
+        # Identical searches already in flight wait for that result instead of
+        # hitting SerpApi again; only the owner searches and writes the cache
+        flights, data_source = coalesced(cache_key, _search_and_cache)
+
+        # Apply nonstop filter to the response
         if nonstop_only and flights:
             before = len(flights)
             flights = [f for f in flights if int(f.get('stops', 0) or 0) == 0]
-            print(f"[NONSTOP] Filter: {before} -> {len(flights)} flights")
+            log.debug("[NONSTOP] Filter: %d -> %d flights", before, len(flights))
 
         response_data = {
             'flights': flights,
@@ -378,18 +764,44 @@ def search_flights():
             'count': len(flights),
             'devMode': DEV_MODE,
             'data_source': data_source,
-            'realtime_available': realtime_service.is_configured(),
+            'realtime_available': REALTIME_CONFIGURED,
             'realtime_hint': 'Use /api/realtime/route for live flight status'
         }
 
         return jsonify(response_data)
 
     except Exception as e:
-        print(f"Error in search_flights: {str(e)}")
+        log.exception("Error in search_flights")
         return jsonify({
             'error': str(e)
         }), 500
 
+def iter_route_results(origins, destinations, departure_date, return_date,
+                       trip_type, airline_filter, nonstop_only):
+    """Yield (route, flights) per origin/destination pair as results arrive."""
+    if FLIGHT_API_ENABLED and flight_client:
+        # Use SerpApi — routes run concurrently, each streamed as soon as it finishes
+        for route, route_flights in flight_client.iter_routes(
+                origins, destinations, departure_date,
+                return_date=return_date if trip_type == 'round-trip' else None,
+                adults=1,
+                airline_filter=airline_filter):
+            if nonstop_only:
+                route_flights = [f for f in route_flights if int(f.get('stops', 0) or 0) == 0]
+            if route_flights:
+                yield route, route_flights
+    else:
+        # Fallback to mock data — same generator as /api/search, split per route
+        flights = generate_mock_flights(origins, destinations, departure_date, return_date)
+        for (origin, destination), route_flights in groupby(
+                flights, key=itemgetter('origin', 'destination')):
+            route_flights = list(route_flights)
+            if nonstop_only:
+                route_flights = [f for f in route_flights if f['stops'] == 0]
+            if route_flights:
+                yield f"{origin}->{destination}", route_flights
+
+
 @app.route('/api/search/stream', methods=['POST'])
 @require_auth
 def search_flights_stream():
@@ -399,140 +811,103 @@ def search_flights_stream():
     Returns results as they become available for each route
     """
     try:
-        data = request.get_json()
-
-        origins = data.get('origins', [])
-        destinations = data.get('destinations', [])
-        trip_type = data.get('tripType', 'round-trip')
-        departure_date = data.get('departureDate')
-        return_date = data.get('returnDate')
-        nonstop_only = bool(data.get('nonstopOnly', False))
-
-        # Airline filter
-        raw_airline = data.get('airlineFilter', 'F9')
-        airline_filter = None if raw_airline in ('ALL', '') else (raw_airline or 'F9')
-
-        # Validate required fields
-        if not origins or not destinations or not departure_date:
-            return jsonify({
-                'error': 'Missing required fields: origins, destinations, departureDate'
-            }), 400
+        params, error = parse_search_request()
+        if error:
+            return error
+        origins = params['origins']
+        destinations = params['destinations']
+        trip_type = params['trip_type']
+        departure_date = params['departure_date']
+        return_date = params['return_date']
+        nonstop_only = params['nonstop_only']
+        airline_filter = params['airline_filter']
+        simulate_delay = params['simulate_delay']
 
         def generate():
             """Generator function for streaming results"""
-            all_flights = []
-
-            if FLIGHT_API_ENABLED and flight_client:
-                # Use SerpApi — stream results per route
-                dest_list = destinations
-                if destinations == ['ANY']:
-                    dest_list = flight_client._get_popular_destinations(origins)
-
-                for origin in origins:
-                    for destination in dest_list:
-                        if origin == destination:
-                            continue
-
-                        try:
-                            route_flights = flight_client._search_route(
-                                origin, destination, departure_date,
-                                return_date=return_date if trip_type == 'round-trip' else None,
-                                adults=1,
-                                airline_filter=airline_filter
-                            )
-                        except Exception as e:
-                            print(f"Error searching {origin}->{destination}: {e}")
-                            route_flights = []
-
-                        if route_flights:
-                            if nonstop_only:
-                                route_flights = [f for f in route_flights if int(f.get('stops', 0) or 0) == 0]
-                            if route_flights:
-                                all_flights.extend(route_flights)
-                                event_data = {
-                                    'route': f"{origin}->{destination}",
-                                    'flights': route_flights,
-                                    'count': len(route_flights)
-                                }
-                                yield f"data: {json.dumps(event_data)}\n\n"
-                        time.sleep(0.1)
-            else:
-                # Fallback to mock data
-                dest_list = destinations if destinations != ['ANY'] else ['MCO', 'LAS', 'MIA', 'PHX', 'ATL']
-                blackout_info = GoWildBlackoutDates.is_flight_affected_by_blackout(departure_date, return_date)
-
-                for origin in origins:
-                    for destination in dest_list[:5]:
-                        if origin == destination:
-                            continue
-
-                        route_flights = []
-                        for _ in range(random.randint(1, 3)):
-                            hour = random.randint(6, 20)
-                            minute = random.choice(['00', '15', '30', '45'])
-                            flight = {
-                                'origin': origin,
-                                'destination': destination,
-                                'departure_date': departure_date,
-                                'departure_time': f"{hour:02d}:{minute} {'AM' if hour < 12 else 'PM'}",
-                                'arrival_date': departure_date,
-                                'arrival_time': f"{(hour+3):02d}:{minute} {'AM' if (hour+3) < 12 else 'PM'}",
-                                'duration': '3h 0m',
-                                'price': round(random.uniform(29, 199), 2),
-                                'currency': 'USD',
-                                'airline': 'Frontier Airlines',
-                                'flight_number': f"F9{random.randint(1000, 9999)}",
-                                'stops': 0,
-                                'aircraft': 'A320',
-                                'is_round_trip': False,
-                                'gowild_eligible': random.choice([True, True, False]),
-                                'blackout_dates': blackout_info
-                            }
-                            route_flights.append(flight)
-
-                        all_flights.extend(route_flights)
-                        event_data = {
-                            'route': f"{origin}->{destination}",
-                            'flights': route_flights,
-                            'count': len(route_flights)
-                        }
-                        yield f"data: {json.dumps(event_data)}\n\n"
-                        time.sleep(0.1)
+            total_flights = 0
+            for route, route_flights in iter_route_results(
+                    origins, destinations, departure_date, return_date,
+                    trip_type, airline_filter, nonstop_only):
+                total_flights += len(route_flights)
+                yield sse_event({
+                    'route': route,
+                    'flights': route_flights,
+                    'count': len(route_flights)
+                })
+                if simulate_delay:
+                    time.sleep(0.1)
 
             # Send completion event
-            completion_data = {
+            yield sse_event({
                 'complete': True,
-                'total_flights': len(all_flights),
-                'realtime_available': realtime_service.is_configured()
-            }
-            yield f"data: {json.dumps(completion_data)}\n\n"
-
-        return Response(
-            stream_with_context(generate()),
-            mimetype='text/event-stream',
-            headers={
-                'Cache-Control': 'no-cache',
-                'X-Accel-Buffering': 'no'
-            }
-        )
+                'total_flights': total_flights,
+                'realtime_available': REALTIME_CONFIGURED
+            })
+
+        return stream_response(generate(), 'text/event-stream', {'Cache-Control': 'no-cache'})
 
     except Exception as e:
-        print(f"Error in search_flights_stream: {str(e)}")
+        log.exception("Error in search_flights_stream")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/destinations', methods=['GET'])
-def get_destinations():
-    """Get list of all Frontier Airlines destinations"""
+@app.route('/api/search/ndjson', methods=['POST'])
+@require_auth
+def search_flights_ndjson():
+    """
+    Search for flights, streaming newline-delimited JSON (one line per route)
+
+    Same request body as /api/search. Each line is {route, flights, count};
+    the final line is {complete, total_flights}.
+    """
+    try:
+        params, error = parse_search_request()
+        if error:
+            return error
+        origins = params['origins']
+        destinations = params['destinations']
+        trip_type = params['trip_type']
+        departure_date = params['departure_date']
+        return_date = params['return_date']
+        nonstop_only = params['nonstop_only']
+        airline_filter = params['airline_filter']
+
+        def generate():
+            total_flights = 0
+            for route, route_flights in iter_route_results(
+                    origins, destinations, departure_date, return_date,
+                    trip_type, airline_filter, nonstop_only):
+                total_flights += len(route_flights)
+                yield ndjson_line({
+                    'route': route,
+                    'flights': route_flights,
+                    'count': len(route_flights)
+                })
+
+            yield ndjson_line({
+                'complete': True,
+                'total_flights': total_flights,
+                'realtime_available': REALTIME_CONFIGURED
+            })
+
+        return stream_response(generate(), 'application/x-ndjson', {})
+
+    except Exception as e:
+        log.exception("Error in search_flights_ndjson")
+        return jsonify({'error': str(e)}), 500
+
+def _build_destinations_body():
+    """Serialize the Frontier destination list (fixed for the life of the process)."""
     if FLIGHT_API_ENABLED and flight_client:
         try:
             destinations = flight_client.get_frontier_destinations()
-            return jsonify({
+            return app.json.dumps({
                 'destinations': destinations,
                 'count': len(destinations),
                 'source': 'serpapi'
-            })
+            }).encode()
         except Exception as e:
-            print(f"Error fetching destinations: {e}")
+            log.warning("Error fetching destinations: %s", e)
 
     # Fallback: hardcoded Frontier destinations
     destinations = [
@@ -550,11 +925,25 @@ def get_destinations():
         {'code': 'DFW', 'city': 'Dallas', 'country': 'US'},
         {'code': 'SEA', 'city': 'Seattle', 'country': 'US'},
     ]
-    return jsonify({
+    return app.json.dumps({
         'destinations': destinations,
         'count': len(destinations),
         'source': 'hardcoded'
-    })
+    }).encode()
+
+
+_DESTINATIONS_BODY = _build_destinations_body()
+
+
+@app.route('/api/destinations', methods=['GET'])
+def get_destinations():
+    """Get list of all Frontier Airlines destinations"""
+    return Response(_DESTINATIONS_BODY, mimetype='application/json')
+
+def _ymd(d):
+    """Format a date/datetime as YYYY-MM-DD (cheaper than strftime)."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
 
 @app.route('/api/trip-planner', methods=['POST'])
 @require_auth
@@ -586,71 +975,95 @@ def trip_planner():
                 'error': 'Missing required fields: origins, destinations, departureDate, tripLength'
             }), 400
 
-        # Calculate return date window (search several days to find options)
-        depart_dt = datetime.strptime(departure_date, '%Y-%m-%d')
+        if not _is_iso_date(departure_date):
+            return jsonify({'error': 'departureDate must be a YYYY-MM-DD date'}), 400
+
+        # Calculate return date window (search several days to find options).
+        # Already validated as YYYY-MM-DD, so the C fromisoformat parser is
+        # enough; strptime would take the locale lock on every call
+        depart_dt = datetime.fromisoformat(departure_date)
         trip_hours = float(trip_length) * (24 if trip_length_unit == 'days' else 1)
 
-        all_flights = []
         optimal_trips = []
         days_searched = 0
         max_days_to_search = 30
 
-        # Keep searching future dates until we find results or hit 30 days
-        while len(optimal_trips) == 0 and days_searched < max_days_to_search:
-            current_depart_dt = depart_dt + timedelta(days=days_searched)
-            current_departure_date = current_depart_dt.strftime('%Y-%m-%d')
-            target_return = current_depart_dt + timedelta(hours=trip_hours)
+        # Candidate departure days and the ±2-day return window offsets
+        depart_days = [depart_dt + timedelta(days=i) for i in range(max_days_to_search)]
+        return_offsets = [timedelta(days=d) for d in (-2, -1, 0, 1, 2)]
+        trip_delta = timedelta(hours=trip_hours)
+
+        search_enabled = FLIGHT_API_ENABLED and flight_client
 
+        def _search_round_trip(dep_date, ret_date):
+            return flight_client.search_flights(
+                origins=origins,
+                destinations=destinations,
+                departure_date=dep_date,
+                return_date=ret_date,
+                adults=1,
+                airline_filter=airline_filter
+            )
+
+        def _submit_day(day_index):
+            """Start the ±2-day return-window searches for one departure day."""
+            depart = depart_days[day_index]
+            target_return = depart + trip_delta
+            departure_str = _ymd(depart)
             # Search a range of dates around target (±2 days for flexibility)
-            return_dates = [
-                (target_return - timedelta(days=2)).strftime('%Y-%m-%d'),
-                (target_return - timedelta(days=1)).strftime('%Y-%m-%d'),
-                target_return.strftime('%Y-%m-%d'),
-                (target_return + timedelta(days=1)).strftime('%Y-%m-%d'),
-                (target_return + timedelta(days=2)).strftime('%Y-%m-%d'),
-            ]
-
-            print(f"Searching departure date: {current_departure_date} (day {days_searched + 1}/{max_days_to_search})")
-
-            # Search for round trips with each return date IN PARALLEL
-            def _search_return_date(ret_date):
-                if FLIGHT_API_ENABLED and flight_client:
-                    return flight_client.search_flights(
-                        origins=origins,
-                        destinations=destinations,
-                        departure_date=current_departure_date,
-                        return_date=ret_date,
-                        adults=1,
-                        airline_filter=airline_filter
-                    )
-                return []
-
-            batch_flights = []
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = {executor.submit(_search_return_date, rd): rd for rd in return_dates}
-                for future in as_completed(futures):
+            return_dates = [_ymd(target_return + offset) for offset in return_offsets]
+            futures = [(rd, search_executor.submit(_search_round_trip, departure_str, rd))
+                       for rd in return_dates] if search_enabled else []
+            return departure_str, futures
+
+        # Day index -> (departure date, futures); days ahead of the current one
+        # are searched speculatively when TRIP_PLANNER_LOOKAHEAD > 0
+        pending = {}
+
+        try:
+            # Keep searching future dates until we find results or hit 30 days
+            while len(optimal_trips) == 0 and days_searched < max_days_to_search:
+                for day in range(days_searched, min(days_searched + 1 + TRIP_PLANNER_LOOKAHEAD,
+                                                     max_days_to_search)):
+                    if day not in pending:
+                        pending[day] = _submit_day(day)
+                # Stays in pending until collected so the finally can cancel it too
+                current_departure_date, futures = pending[days_searched]
+
+                log.debug("Searching departure date: %s (day %d/%d)",
+                          current_departure_date, days_searched + 1, max_days_to_search)
+
+                # Return-date searches for the day run IN PARALLEL
+                batch_flights = []
+                for rd, future in futures:
                     try:
                         batch_flights.extend(future.result())
                     except Exception as e:
-                        print(f"Error searching return date {futures[future]}: {e}")
-
-            all_flights.extend(batch_flights)
-
-            # Use trip planner to find optimal combinations
-            optimal_trips = find_optimal_trips(
-                all_flights,
-                trip_length=trip_length,
-                trip_length_unit=trip_length_unit,
-                nonstop_preferred=nonstop_preferred,
-                max_duration=max_trip_duration,
-                max_duration_unit=max_trip_duration_unit
-            )
+                        log.warning("Error searching return date %s: %s", rd, e)
+                del pending[days_searched]
+
+                # Flights are scored independently and earlier days produced no
+                # trips (we'd have stopped), so only this day's batch needs scoring
+                optimal_trips = find_optimal_trips(
+                    batch_flights,
+                    trip_length=trip_length,
+                    trip_length_unit=trip_length_unit,
+                    nonstop_preferred=nonstop_preferred,
+                    max_duration=max_trip_duration,
+                    max_duration_unit=max_trip_duration_unit
+                )
 
-            if len(optimal_trips) > 0:
-                print(f"Found {len(optimal_trips)} matching trips on day {days_searched + 1}")
-                break
+                if len(optimal_trips) > 0:
+                    log.debug("Found %d matching trips on day %d", len(optimal_trips), days_searched + 1)
+                    break
 
-            days_searched += 1
+                days_searched += 1
+        finally:
+            # Drop speculative searches that haven't started yet, including
+            # when the loop raises, so queued searches don't keep spending quota
+            for _, futures in pending.values():
+                for _, future in futures:
+                    future.cancel()
 
         # Return top 20 best matches
         return jsonify({
@@ -658,13 +1071,11 @@ def trip_planner():
             'total_options': len(optimal_trips),
             'target_duration': f"{trip_length} {trip_length_unit}",
             'days_searched': days_searched + 1,
-            'earliest_departure': (depart_dt + timedelta(days=days_searched)).strftime('%Y-%m-%d') if optimal_trips else None
+            'earliest_departure': _ymd(depart_days[days_searched]) if optimal_trips else None
         })
 
     except Exception as e:
-        print(f"Error in trip_planner: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in trip_planner")
         return jsonify({
             'error': str(e)
         }), 500
@@ -672,6 +1083,7 @@ def trip_planner():
 @app.route('/api/cache/clear', methods=['POST'])
 def clear_cache():
     """Clear the flight cache"""
+    search_l1.clear()
     flask_cache.clear()
     return jsonify({'message': 'Cache cleared successfully'})
 
@@ -679,8 +1091,11 @@ def clear_cache():
 def cache_stats():
     """Get cache statistics"""
     return jsonify({
-        'cache_type': 'FileSystemCache',
-        'message': 'File-based cache active — survives restarts'
+        'cache_type': cache_config['CACHE_TYPE'],
+        'message': 'Redis cache active — shared across workers' if REDIS_URL
+                   else 'File-based cache active — survives restarts',
+        'realtime_cache': realtime_service.get_cache_stats(),
+        'blackout_lookup_cache': GoWildBlackoutDates.is_flight_affected_by_blackout.cache_info()._asdict()
     })
 
 @app.route('/api/debug/search', methods=['POST'])
@@ -696,7 +1111,7 @@ def debug_search():
             'flight_api_enabled': FLIGHT_API_ENABLED,
             'dev_mode': DEV_MODE,
             'flight_client_status': 'initialized' if flight_client else 'not initialized',
-            'realtime_configured': realtime_service.is_configured(),
+            'realtime_configured': REALTIME_CONFIGURED,
             'steps': [],
             'flights': [],
             'errors': []
@@ -730,8 +1145,8 @@ def debug_search():
                             airline_filter=None
                         )
                         debug_info['steps'].append(f"All airlines results: {len(flights_all)} flights")
-                        airlines = list(set(f.get('airline', 'Unknown') for f in flights_all))
-                        debug_info['airlines_available'] = airlines
+                        debug_info['airlines_available'] = sorted(
+                            {f.get('airline', 'Unknown') for f in flights_all})
 
             except Exception as e:
                 debug_info['errors'].append(f"SerpApi search exception: {str(e)}")
@@ -741,11 +1156,11 @@ def debug_search():
         return jsonify(debug_info)
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }), 500
+        log.exception("Debug search failed")
+        error = {'error': str(e)}
+        if app.debug:
+            error['traceback'] = traceback.format_exc()
+        return jsonify(error), 500
 
 # =============================================================================
 # REAL-TIME FLIGHT STATUS ENDPOINTS (powered by AeroDataBox)
@@ -774,6 +1189,33 @@ def get_realtime_flight_status(flight_number):
     
     return jsonify({'flight': result})
 
+@app.route('/api/realtime/flights', methods=['GET'])
+@require_auth
+def get_realtime_flight_statuses():
+    """
+    Get real-time status for several flights in one call
+
+    Query params:
+    - flights: Comma-separated flight numbers (required, at most 20 distinct)
+
+    Example: GET /api/realtime/flights?flights=F9777,AA3075
+
+    Note: Falls back to mock data if AeroDataBox API is unavailable
+    """
+    flight_numbers = [f.strip() for f in request.args.get('flights', '').split(',') if f.strip()]
+
+    if not flight_numbers:
+        return jsonify({
+            'error': 'Missing required parameter: flights'
+        }), 400
+
+    try:
+        statuses = realtime_service.get_flight_statuses(flight_numbers)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({'flights': statuses})
+
 @app.route('/api/realtime/route', methods=['GET'])
 @require_auth
 def get_realtime_route_flights():
@@ -852,6 +1294,27 @@ def get_realtime_arrivals(airport_code):
     
     return jsonify(result)
 
+@app.route('/api/realtime/board/<airport_code>', methods=['GET'])
+@require_auth
+def get_realtime_board(airport_code):
+    """
+    Get real-time departures and arrivals for an airport in one call
+
+    Query params:
+    - airline: Airline code (default: ALL)
+
+    Example: GET /api/realtime/board/DEN?airline=F9
+
+    Both boards are fetched concurrently. Falls back to mock data if
+    AeroDataBox API is unavailable
+    """
+    raw_airline = request.args.get('airline', 'ALL')
+    airline = None if raw_airline.upper() == 'ALL' else raw_airline
+
+    result = realtime_service.get_board(airport_code.upper(), airline.upper() if airline else None)
+
+    return jsonify(result)
+
 
 @app.route('/api/realtime/flight/<flight_number>/live', methods=['GET'])
 @require_auth
@@ -866,14 +1329,42 @@ def get_realtime_flight_live(flight_number):
 # BLACKOUT DATES ENDPOINTS
 # =============================================================================
 
+# Serialized /api/blackout-dates body, rebuilt only when the cache file changes
+_blackout_response = {'mtime': None, 'body': None, 'etag': None}
+
+
+def _blackout_body():
+    """Return (body, etag) for the current blackout data."""
+    global _blackout_response
+    try:
+        mtime = os.stat(BLACKOUT_CACHE_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    cached = _blackout_response
+    if mtime is not None and cached['mtime'] == mtime:
+        return cached['body'], cached['etag']
+
+    data = get_blackout_data()
+    body = orjson.dumps(data) if orjson is not None else app.json.dumps(data).encode()
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    if mtime is not None:
+        # Swap the whole dict so concurrent readers never see a mixed entry
+        _blackout_response = {'mtime': mtime, 'body': body, 'etag': etag}
+    return body, etag
+
+
 @app.route('/api/blackout-dates', methods=['GET'])
 def get_blackout_dates():
-    """Get current blackout dates"""
+    """Get current blackout dates (ETag-validated; 304 when unchanged)"""
     try:
-        blackout_data = get_blackout_data()
-        return jsonify(blackout_data)
+        body, etag = _blackout_body()
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+        return response.make_conditional(request)
     except Exception as e:
-        print(f"Error fetching blackout dates: {e}")
+        log.exception("Error fetching blackout dates")
         return jsonify({
             'error': str(e),
             'blackout_periods': {'2026': [], '2027': [], '2028': []},
@@ -884,7 +1375,6 @@ def get_blackout_dates():
 def refresh_blackout_dates():
     """Manually refresh blackout dates from Frontier website"""
     try:
-        from blackout_updater import fetch_blackout_dates
         data = fetch_blackout_dates()
         return jsonify({
             'message': 'Blackout dates refreshed successfully',
@@ -31,15 +31,23 @@ from __future__ import annotations
 import json
 import os
 import re
+import tempfile
+from html import unescape
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+
+try:
+    import orjson  # optional: faster cache file reads and writes
+except ImportError:
+    orjson = None
 
 FRONTIER_URL = "https://www.flyfrontier.com/frontiermiles/terms-and-conditions/#GoWild!_Pass"
 CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blackout_cache.json")
 UPDATE_INTERVAL_DAYS = 30  # Check monthly
+FALLBACK_RETRY_HOURS = 6  # Retry the scraper sooner when the cache holds fallback data
 
 # Years we actually serve from the API. 2028 is intentionally excluded — the page
 # says "Blackout dates for May 2027 and beyond will be posted in advance".
@@ -50,6 +58,8 @@ MONTHS: Dict[str, int] = {
     "may": 5, "june": 6, "july": 7, "august": 8,
     "september": 9, "october": 10, "november": 11, "december": 12,
 }
+# Month number -> English name, so labels don't depend on strftime's locale
+MONTH_NAMES: Tuple[str, ...] = ("",) + tuple(name.capitalize() for name in MONTHS)
 
 # Phrases that, if found inside or near the candidate block, mean we picked up
 # the wrong region of the page (e.g. an "Annual Pass" contractual passage rather
@@ -64,25 +74,103 @@ DENYLIST_PHRASES = (
     "enrollment price",
 )
 
+# Patterns used by the scraper, compiled once at import
+_GOWILD_HEADING_RE = re.compile(r"\d+\.\s*gowild!?\s*pass")
+_YEAR_MARKER_RE = re.compile(r"\b20(2[6-9]|3\d)\s*:")
+_DISCLAIMER_RE = re.compile(
+    r"Blackout dates for [A-Za-z]+ \d{4} and beyond will be posted", re.IGNORECASE
+)
+_SECTION_END_RE = re.compile(r"\n\s*\n\s*\n")
+_YEAR_LINE_RE = re.compile(
+    r"(?P<year>20\d{2})\s*:\s*(?P<body>.+?)(?=\n\s*20\d{2}\s*:|\Z)", re.DOTALL
+)
+_MONTH_GROUP_RE = re.compile(
+    r"(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)\s+(?P<rest>.+)",
+    re.IGNORECASE,
+)
+_MONTH_INITIALS = frozenset("JFMASONDjfmasond")
+_DAY_TOKEN_RE = re.compile(r"^(\d{1,2})(?:\s*-\s*(\d{1,2}))?$")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Markup whose text is never shown (comments, scripts, styles), then any tag.
+# A tag must start with a name, "/", "!" or "?" (as in the HTML tokenizer), so a
+# literal "<" in text (e.g. "< 10 days") isn't swallowed up to the next ">".
+_HIDDEN_MARKUP_RE = re.compile(
+    r"<!--.*?-->|<(script|style|template)\b.*?</\1\s*>", re.DOTALL | re.IGNORECASE
+)
+_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+
 
 # =============================================================================
 # Caching helpers
 # =============================================================================
 
+# (mtime_ns, size) of CACHE_FILE when it was last parsed, and the parsed dict
+_cache_memo: Tuple[Optional[Tuple[int, int]], Optional[Dict]] = (None, None)
+
+
+def _read_cache() -> Dict:
+    """
+    Parse CACHE_FILE, reusing the previous parse while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    Raises OSError/ValueError like open()/json.loads().
+    """
+    global _cache_memo
+    st = os.stat(CACHE_FILE)
+    version = (st.st_mtime_ns, st.st_size)
+    memo_version, data = _cache_memo
+    if memo_version != version or data is None:
+        with open(CACHE_FILE, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        _cache_memo = (version, data)
+    return data
+
+
 def should_update() -> bool:
-    """Return True if the cache is missing or older than UPDATE_INTERVAL_DAYS."""
+    """
+    Return True if the cache is missing or older than UPDATE_INTERVAL_DAYS.
+
+    A cache that holds fallback data (the last scrape failed) goes stale after
+    FALLBACK_RETRY_HOURS instead, so one bad scrape doesn't pin it for a month.
+    """
     if not os.path.exists(CACHE_FILE):
         return True
     try:
-        with open(CACHE_FILE, "r") as f:
-            cache = json.load(f)
-            last_update = datetime.fromisoformat(cache.get("last_updated", "2000-01-01"))
-            return (datetime.now() - last_update).days >= UPDATE_INTERVAL_DAYS
+        cache = _read_cache()
+        last_update = datetime.fromisoformat(cache.get("last_updated", "2000-01-01"))
+        age = datetime.now() - last_update
+        if cache.get("source") != "scraper":
+            return age >= timedelta(hours=FALLBACK_RETRY_HOURS)
+        return age.days >= UPDATE_INTERVAL_DAYS
     except Exception as e:
         print(f"Error checking update time: {e}")
         return True
 
 
+def _write_cache(data: Dict) -> None:
+    """Write the cache atomically so readers never see a half-written file."""
+    global _cache_memo
+    _cache_memo = (None, None)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_FILE) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates the file 0600; keep the cache world-readable as before
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, CACHE_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 # =============================================================================
 # Description lookup — prefer hand-curated labels, fall back to US holidays
 # =============================================================================
@@ -120,6 +208,7 @@ def _last_weekday(year: int, month: int, weekday: int) -> date:
     return d
 
 
+@lru_cache(maxsize=1024)
 def _us_holiday_label(d: date) -> Optional[str]:
     """Return a US-federal holiday label for the given date, or None."""
     y, m, day = d.year, d.month, d.day
@@ -144,11 +233,17 @@ def _us_holiday_label(d: date) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=512)
 def _fallback_description(start: str, end: str) -> str:
-    """Generate a descriptive label when no curated entry matches."""
+    """
+    Generate a descriptive label when no curated entry matches.
+
+    Memoized: every refresh re-labels mostly the same (start, end) pairs, and
+    multi-day ranges otherwise re-run the holiday checks for each day.
+    """
     try:
-        s = datetime.strptime(start, "%Y-%m-%d").date()
-        e = datetime.strptime(end, "%Y-%m-%d").date()
+        s = date.fromisoformat(start)
+        e = date.fromisoformat(end)
     except ValueError:
         return "Blackout period"
 
@@ -157,7 +252,7 @@ def _fallback_description(start: str, end: str) -> str:
         label = _us_holiday_label(s)
         if label:
             return label
-        return s.strftime("%B %-d")
+        return f"{MONTH_NAMES[s.month]} {s.day}"
 
     # Multi-day: see if any day in range is a US holiday and use its name + "Period"
     cur = s
@@ -169,14 +264,24 @@ def _fallback_description(start: str, end: str) -> str:
 
     # Otherwise label by month
     if s.month == e.month:
-        return f"{s.strftime('%B')} Period"
-    return f"{s.strftime('%B')}–{e.strftime('%B')} Period"
+        return f"{MONTH_NAMES[s.month]} Period"
+    return f"{MONTH_NAMES[s.month]}–{MONTH_NAMES[e.month]} Period"
 
 
 # =============================================================================
 # Scraper
 # =============================================================================
 
+def _html_to_text(html: str) -> str:
+    """
+    Visible text of an HTML page, like BeautifulSoup's get_text().
+
+    The scraper only runs regexes over the text, so building a DOM just to
+    flatten it again is wasted work; stripping the markup directly is enough.
+    """
+    return unescape(_TAG_RE.sub("", _HIDDEN_MARKUP_RE.sub("", html)))
+
+
 def _locate_gowild_blackout_block(text: str) -> Optional[str]:
     """
     Find the GoWild! Pass blackout listing block.
@@ -191,7 +296,7 @@ def _locate_gowild_blackout_block(text: str) -> Optional[str]:
     lower = text.lower()
     # Anchor on the GoWild Pass section heading ("14. GoWild! Pass..."),
     # not the table-of-contents link that appears at the top of the page.
-    heading_match = re.search(r"\d+\.\s*gowild!?\s*pass", lower)
+    heading_match = _GOWILD_HEADING_RE.search(lower)
     gowild_idx = heading_match.start() if heading_match else 0
 
     # Walk through every "subject to blackout periods" occurrence after the
@@ -205,7 +310,7 @@ def _locate_gowild_blackout_block(text: str) -> Optional[str]:
             return None
         # Look ahead a short window for a "YYYY:" marker
         window = text[idx:idx + 400]
-        if re.search(r"\b20(2[6-9]|3\d)\s*:", window):
+        if _YEAR_MARKER_RE.search(window):
             break
         search_from = idx + 1
 
@@ -213,18 +318,14 @@ def _locate_gowild_blackout_block(text: str) -> Optional[str]:
     # sentence ("Blackout dates for May 2027 and beyond will be posted...") or
     # two consecutive blank lines (end of section).
     block_start = idx
-    # Search forward for the disclaimer
-    disclaimer_match = re.search(
-        r"Blackout dates for [A-Za-z]+ \d{4} and beyond will be posted",
-        text[block_start:],
-        flags=re.IGNORECASE,
-    )
+    # Search forward for the disclaimer (pos= avoids copying the page tail)
+    disclaimer_match = _DISCLAIMER_RE.search(text, block_start)
     if disclaimer_match:
-        block_end = block_start + disclaimer_match.start()
+        block_end = disclaimer_match.start()
     else:
         # Fall back: 2 blank lines
-        blank_match = re.search(r"\n\s*\n\s*\n", text[block_start:])
-        block_end = block_start + (blank_match.start() if blank_match else 1500)
+        blank_match = _SECTION_END_RE.search(text, block_start)
+        block_end = blank_match.start() if blank_match else block_start + 1500
 
     block = text[block_start:block_end]
 
@@ -250,6 +351,7 @@ def _parse_year_line(year: str, body: str) -> List[Dict[str, str]]:
     body = body.strip().rstrip(".").rstrip(";").strip()
     if not body:
         return entries
+    year_num = int(year)
 
     # Month groups are `;` separated. Within a group: 'Month day, day-day, ...'.
     for group in body.split(";"):
@@ -258,11 +360,10 @@ def _parse_year_line(year: str, body: str) -> List[Dict[str, str]]:
             continue
 
         # Match the leading month name; the rest is a comma-separated day list.
-        m = re.match(
-            r"(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)\s+(?P<rest>.+)",
-            group,
-            re.IGNORECASE,
-        )
+        # Fragments that can't start with a month name skip the regex.
+        if group[0] not in _MONTH_INITIALS:
+            continue
+        m = _MONTH_GROUP_RE.match(group)
         if not m:
             continue
 
@@ -273,22 +374,25 @@ def _parse_year_line(year: str, body: str) -> List[Dict[str, str]]:
             token = token.strip().rstrip(".").strip()
             if not token:
                 continue
-            # Accept "1", "1-2", "28-30"
-            mr = re.match(r"^(\d{1,2})(?:\s*-\s*(\d{1,2}))?$", token)
-            if not mr:
-                continue
-            start_day = int(mr.group(1))
-            end_day = int(mr.group(2)) if mr.group(2) else start_day
+            # Accept "1", "1-2", "28-30"; a bare day needs no regex
+            if len(token) <= 2 and token.isascii() and token.isdigit():
+                start_day = end_day = int(token)
+            else:
+                mr = _DAY_TOKEN_RE.match(token)
+                if not mr:
+                    continue
+                start_day = int(mr.group(1))
+                end_day = int(mr.group(2)) if mr.group(2) else start_day
             if not (1 <= start_day <= 31 and 1 <= end_day <= 31):
                 continue
             try:
-                start_iso = f"{year}-{month_num:02d}-{start_day:02d}"
-                end_iso = f"{year}-{month_num:02d}-{end_day:02d}"
-                # Validate by round-tripping through datetime
-                datetime.strptime(start_iso, "%Y-%m-%d")
-                datetime.strptime(end_iso, "%Y-%m-%d")
+                # The date constructor rejects days past the end of the month
+                date(year_num, month_num, start_day)
+                date(year_num, month_num, end_day)
             except ValueError:
                 continue
+            start_iso = f"{year}-{month_num:02d}-{start_day:02d}"
+            end_iso = f"{year}-{month_num:02d}-{end_day:02d}"
             entries.append({"start": start_iso, "end": end_iso, "description": ""})
 
     return entries
@@ -299,17 +403,13 @@ def _parse_blackout_block(block: str) -> Dict[str, List[Dict[str, str]]]:
     out: Dict[str, List[Dict[str, str]]] = {y: [] for y in TARGET_YEARS}
 
     # Find lines like "2026: January 1, 3-4 ... December 19-31."
-    for match in re.finditer(
-        r"(?P<year>20\d{2})\s*:\s*(?P<body>.+?)(?=\n\s*20\d{2}\s*:|\Z)",
-        block,
-        flags=re.DOTALL,
-    ):
+    for match in _YEAR_LINE_RE.finditer(block):
         year = match.group("year")
         if year not in TARGET_YEARS:
             continue  # Drop 2025 (past) and 2028+ (not published)
         body = match.group("body")
         # Strip linebreaks inside the body so multi-line wraps still parse
-        body = re.sub(r"\s+", " ", body).strip()
+        body = _WHITESPACE_RE.sub(" ", body).strip()
         out[year].extend(_parse_year_line(year, body))
 
     return out
@@ -343,8 +443,8 @@ def _dedupe(periods: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str
     return out
 
 
-def fetch_blackout_dates() -> Dict:
-    """Fetch + parse blackout dates and cache the result."""
+def fetch_blackout_dates(write_cache: bool = True) -> Dict:
+    """Fetch + parse blackout dates, caching the result unless write_cache is False."""
     print(f"Fetching blackout dates from {FRONTIER_URL}...")
 
     headers = {
@@ -361,8 +461,7 @@ def fetch_blackout_dates() -> Dict:
         print(f"❌ Error fetching Frontier page: {e}")
         return load_cached_data()
 
-    soup = BeautifulSoup(response.content, "html.parser")
-    text_content = soup.get_text()
+    text_content = _html_to_text(response.content.decode("utf-8", errors="replace"))
 
     block = _locate_gowild_blackout_block(text_content)
     if not block:
@@ -391,11 +490,11 @@ def fetch_blackout_dates() -> Dict:
         "source_url": FRONTIER_URL,
     }
 
-    try:
-        with open(CACHE_FILE, "w") as f:
-            json.dump(cache_data, f, indent=2)
-    except Exception as e:
-        print(f"⚠️  Could not write cache: {e}")
+    if write_cache:
+        try:
+            _write_cache(cache_data)
+        except Exception as e:
+            print(f"⚠️  Could not write cache: {e}")
 
     return cache_data
 
@@ -404,8 +503,7 @@ def load_cached_data() -> Dict:
     """Load blackout dates from cache, or fall back to curated data."""
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE, "r") as f:
-                return json.load(f)
+            return _read_cache()
         except Exception as e:
             print(f"Error loading cache: {e}")
     return get_fallback_data()
@@ -416,7 +514,7 @@ def get_fallback_data() -> Dict:
     try:
         from gowild_blackout import GoWildBlackoutDates
 
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = date.today().isoformat()
         blackout_data: Dict[str, List[Dict[str, str]]] = {y: [] for y in (*TARGET_YEARS, "2028")}
 
         for start, end, desc in GoWildBlackoutDates.BLACKOUT_PERIODS_2026:
@@ -443,8 +541,13 @@ def get_fallback_data() -> Dict:
 
 def update_if_needed() -> Dict:
     """Refresh the cache via scraper when possible, else fall back to curated data."""
+    if not should_update():
+        # Cache is fresh; every worker calls this on startup, so don't re-scrape
+        return load_cached_data()
+
     try:
-        scraped = fetch_blackout_dates()
+        # Validate before writing so an implausible scrape never hits the cache
+        scraped = fetch_blackout_dates(write_cache=False)
         # Sanity check: do we have plausible counts for the upcoming year?
         upcoming_year = str(datetime.now().year)
         if upcoming_year not in TARGET_YEARS:
@@ -453,6 +556,10 @@ def update_if_needed() -> Dict:
 
         if upcoming_count >= 10 and scraped.get("source") == "scraper":
             print(f"✅ Using scraped blackout dates ({upcoming_count} for {upcoming_year})")
+            try:
+                _write_cache(scraped)
+            except Exception as e:
+                print(f"⚠️  Could not write cache: {e}")
             return scraped
 
         print(f"⚠️  Scraper returned {upcoming_count} entries for {upcoming_year} — using curated fallback")
@@ -461,8 +568,7 @@ def update_if_needed() -> Dict:
 
     data = get_fallback_data()
     try:
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_cache(data)
     except Exception as e:
         print(f"⚠️  Could not write fallback cache: {e}")
     return data
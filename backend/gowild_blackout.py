@@ -6,7 +6,8 @@ Based on Frontier Airlines GoWild pass terms and conditions.
 Auto-updated from: https://www.flyfrontier.com/frontiermiles/terms-and-conditions/#GoWild!_Pass
 """
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 class GoWildBlackoutDates:
     """
@@ -101,15 +102,33 @@ class GoWildBlackoutDates:
         Returns:
             List of tuples: (start_datetime, end_datetime, description)
         """
-        all_periods = []
+        return list(cls._parsed_periods())
 
-        for start_str, end_str, description in (cls.BLACKOUT_PERIODS_2026 +
-                                                 cls.BLACKOUT_PERIODS_2027):
-            start_date = datetime.strptime(start_str, '%Y-%m-%d')
-            end_date = datetime.strptime(end_str, '%Y-%m-%d')
-            all_periods.append((start_date, end_date, description))
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _parsed_periods(cls) -> Tuple[Tuple[datetime, datetime, str], ...]:
+        """Parse the static period tables once; every lookup reuses the result."""
+        return tuple(
+            (datetime.strptime(start_str, '%Y-%m-%d'),
+             datetime.strptime(end_str, '%Y-%m-%d'),
+             description)
+            for start_str, end_str, description in (cls.BLACKOUT_PERIODS_2026 +
+                                                     cls.BLACKOUT_PERIODS_2027)
+        )
 
-        return all_periods
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _blackout_index(cls) -> Dict[str, str]:
+        """Map every blacked-out 'YYYY-MM-DD' day to its period description."""
+        index: Dict[str, str] = {}
+        one_day = timedelta(days=1)
+        for start_date, end_date, description in cls._parsed_periods():
+            day = start_date
+            while day <= end_date:
+                # Earlier periods win on overlap, matching the old linear scan
+                index.setdefault(f"{day.year:04d}-{day.month:02d}-{day.day:02d}", description)
+                day += one_day
+        return index
 
     @classmethod
     def is_blackout_date(cls, date_to_check: str) -> Tuple[bool, Optional[str]]:
@@ -124,23 +143,29 @@ class GoWildBlackoutDates:
             - is_blackout: True if date is in blackout period
             - reason: Description of blackout period (if applicable)
         """
-        try:
-            check_date = datetime.strptime(date_to_check, '%Y-%m-%d')
-        except ValueError:
+        index = cls._blackout_index()
+        description = index.get(date_to_check)
+        if description is None and len(date_to_check) != 10:
+            # Unpadded input such as '2026-1-1' still parses with strptime
+            try:
+                check_date = datetime.strptime(date_to_check, '%Y-%m-%d')
+            except ValueError:
+                return (False, None)
+            description = index.get(check_date.strftime('%Y-%m-%d'))
+
+        if description is None:
             return (False, None)
-
-        for start_date, end_date, description in cls.get_all_blackout_periods():
-            if start_date <= check_date <= end_date:
-                return (True, description)
-
-        return (False, None)
+        return (True, description)
 
     @classmethod
+    @lru_cache(maxsize=512)
     def is_flight_affected_by_blackout(cls, departure_date: str, return_date: Optional[str] = None) -> dict:
         """
         Check if a flight is affected by blackout dates.
 
         For round-trip flights, checks both departure and return dates.
+        Results are memoized per (departure_date, return_date) and the same
+        dict is shared by every flight on those dates — treat it as read-only.
 
         Args:
             departure_date: Departure date in 'YYYY-MM-DD' format
@@ -237,7 +262,7 @@ class GoWildBlackoutDates:
 
         affected_periods = []
 
-        for blackout_start, blackout_end, description in cls.get_all_blackout_periods():
+        for blackout_start, blackout_end, description in cls._parsed_periods():
             # Check if blackout period overlaps with range
             if blackout_start <= range_end and blackout_end >= range_start:
                 affected_periods.append({
@@ -0,0 +1,17 @@
+"""
+Gunicorn settings shared by every deploy target (Render, Railway, Fly, Procfile).
+
+Gunicorn loads ./gunicorn.conf.py automatically, so the start commands only
+need `gunicorn app:app`. The default sync worker serves one request at a time,
+which lets a single /api/search/stream hold the whole worker; threaded workers
+keep health checks and other searches moving while streams are open.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+# Streams and trip-planner searches can run well past gunicorn's 30s default
+timeout = 120
+keepalive = 5
@@ -7,17 +7,32 @@ low-cost carriers like Frontier Airlines (F9), Spirit (NK), Allegiant (G4).
 API Documentation: https://serpapi.com/google-flights-api
 Free tier: 250 searches/month
 """
+import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from gowild_blackout import GoWildBlackoutDates
 
+log = logging.getLogger('wildpass.serpapi')
+
 
 class SerpApiFlightSearch:
     """Flight search using SerpApi Google Flights — includes Frontier Airlines (F9)"""
 
     BASE_URL = "https://serpapi.com/search.json"
 
+    # Upper bound on in-flight SerpApi requests per process
+    MAX_CONCURRENT_ROUTES = 6
+
+    # Popular Frontier destinations searched for 'ANY', in priority order
+    POPULAR_DESTINATIONS = (
+        'MCO', 'LAS', 'MIA', 'PHX', 'ATL', 'LAX', 'DFW', 'ORD', 'DEN',
+        'SEA', 'SFO', 'FLL', 'TPA', 'SAN', 'AUS', 'CLE', 'BNA', 'SLC',
+    )
+
     # IATA code to city name mapping for Frontier destinations
     AIRPORT_CITIES = {
         'DEN': 'Denver', 'LAS': 'Las Vegas', 'PHX': 'Phoenix', 'LAX': 'Los Angeles',
@@ -56,6 +71,16 @@ class SerpApiFlightSearch:
                 "SerpApi key not provided. Set SERPAPI_KEY environment variable "
                 "or pass api_key to constructor. Sign up at https://serpapi.com"
             )
+        # One pooled session so concurrent route searches reuse TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.MAX_CONCURRENT_ROUTES,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        ))
+        # Route searches are I/O bound; fan them out instead of running serially
+        self._pool = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_ROUTES,
+                                        thread_name_prefix='serpapi')
         print("SerpApi Google Flights initialized")
 
     def search_flights(self, origins, destinations, departure_date, return_date=None,
@@ -81,28 +106,67 @@ class SerpApiFlightSearch:
         if destinations == ['ANY']:
             destinations = self._get_popular_destinations(origins)
 
-        for origin in origins:
-            for destination in destinations:
-                if origin == destination:
-                    continue
+        # Issue every route request up front; collect in submission order so
+        # results and callbacks stay deterministic
+        futures = [
+            (origin, destination, self._pool.submit(
+                self._search_route, origin, destination, departure_date,
+                return_date=return_date, adults=adults,
+                airline_filter=airline_filter
+            ))
+            for origin in origins
+            for destination in destinations
+            if origin != destination
+        ]
 
-                try:
-                    flights = self._search_route(
-                        origin, destination, departure_date,
-                        return_date=return_date, adults=adults,
-                        airline_filter=airline_filter
-                    )
-                    all_flights.extend(flights)
+        for origin, destination, future in futures:
+            try:
+                flights = future.result()
+                all_flights.extend(flights)
 
-                    if callback and flights:
-                        callback(f"{origin}->{destination}", flights)
+                if callback and flights:
+                    callback(f"{origin}->{destination}", flights)
 
-                except Exception as e:
-                    print(f"Error searching {origin} -> {destination}: {e}")
-                    continue
+            except Exception as e:
+                log.warning("Error searching %s -> %s: %s", origin, destination, e)
+                continue
 
         return all_flights
 
+    def iter_routes(self, origins, destinations, departure_date, return_date=None,
+                    adults=1, airline_filter='F9'):
+        """
+        Search every route concurrently, yielding (route, flights) as each finishes.
+
+        Unlike search_flights, results arrive in completion order so a caller
+        can stream the fastest routes first. Failed routes are logged and
+        skipped. Closing the generator early cancels routes not yet started.
+        """
+        if destinations == ['ANY']:
+            destinations = self._get_popular_destinations(origins)
+
+        futures = {
+            self._pool.submit(
+                self._search_route, origin, destination, departure_date,
+                return_date=return_date, adults=adults,
+                airline_filter=airline_filter
+            ): f"{origin}->{destination}"
+            for origin in origins
+            for destination in destinations
+            if origin != destination
+        }
+
+        try:
+            for future in as_completed(futures):
+                route = futures[future]
+                try:
+                    yield route, future.result()
+                except Exception as e:
+                    log.warning("Error searching %s: %s", route, e)
+        finally:
+            for future in futures:
+                future.cancel()
+
     def _search_route(self, origin, destination, departure_date,
                       return_date=None, adults=1, airline_filter='F9'):
         """
@@ -133,18 +197,19 @@ class SerpApiFlightSearch:
         if airline_filter:
             params['include_airlines'] = airline_filter
 
-        response = requests.get(self.BASE_URL, params=params, timeout=30)
+        response = self.session.get(self.BASE_URL, params=params, timeout=30)
 
         if response.status_code != 200:
             error_detail = response.text[:200] if response.text else 'No details'
-            print(f"SerpApi error ({response.status_code}) for {origin}->{destination}: {error_detail}")
+            log.warning("SerpApi error (%s) for %s->%s: %s",
+                        response.status_code, origin, destination, error_detail)
             return []
 
         data = response.json()
 
         # Check for API errors
         if 'error' in data:
-            print(f"SerpApi error for {origin}->{destination}: {data['error']}")
+            log.warning("SerpApi error for %s->%s: %s", origin, destination, data['error'])
             return []
 
         # Google Flights returns best_flights and other_flights
@@ -152,7 +217,8 @@ class SerpApiFlightSearch:
         other = data.get('other_flights', [])
         all_results = best + other
 
-        print(f"Found {len(all_results)} {airline_filter or 'all'} flights for {origin}->{destination}")
+        log.debug("Found %d %s flights for %s->%s",
+                  len(all_results), airline_filter or 'all', origin, destination)
 
         flights = []
         for result in all_results:
@@ -163,7 +229,7 @@ class SerpApiFlightSearch:
                 if converted:
                     flights.append(converted)
             except Exception as e:
-                print(f"Error converting flight result: {e}")
+                log.warning("Error converting flight result: %s", e)
                 continue
 
         return flights
@@ -342,11 +408,7 @@ class SerpApiFlightSearch:
 
     def _get_popular_destinations(self, origins):
         """Get popular Frontier destinations for 'ANY' search."""
-        popular = [
-            'MCO', 'LAS', 'MIA', 'PHX', 'ATL', 'LAX', 'DFW', 'ORD', 'DEN',
-            'SEA', 'SFO', 'FLL', 'TPA', 'SAN', 'AUS', 'CLE', 'BNA', 'SLC',
-        ]
-        return [d for d in popular if d not in origins][:12]
+        return [d for d in self.POPULAR_DESTINATIONS if d not in origins][:12]
 
     def get_frontier_destinations(self):
         """
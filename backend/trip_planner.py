@@ -2,6 +2,26 @@
 Trip Planner - Find optimal flight combinations based on desired trip length
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+
+# Flight times arrive as 12-hour ("06:30 AM") or 24-hour ("06:30") strings
+_DATETIME_FORMATS = ('%Y-%m-%d %I:%M %p', '%Y-%m-%d %H:%M')
+
+
+@lru_cache(maxsize=2048)
+def _parse_datetime(value):
+    """Parse a 'YYYY-MM-DD time' string, or None if no known format matches.
+
+    Cached because the same departure/return timestamps recur across the
+    trip planner's date window and strptime is the dominant per-flight cost.
+    """
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
 
 def calculate_trip_duration_hours(outbound_depart, return_arrive):
     """Calculate trip duration in hours between two datetime objects"""
@@ -41,19 +61,11 @@ def find_optimal_trips(flights, trip_length, trip_length_unit='days', nonstop_pr
     scored_flights = []
     for flight in round_trip_flights:
         try:
-            # Parse departure and return times
-            depart_str = f"{flight['departure_date']} {flight['departure_time']}"
-            return_str = f"{flight['return_flight']['arrival_date']} {flight['return_flight']['arrival_time']}"
-
-            # Handle both 12-hour and 24-hour formats
-            for fmt in ['%Y-%m-%d %I:%M %p', '%Y-%m-%d %H:%M']:
-                try:
-                    depart_dt = datetime.strptime(depart_str, fmt)
-                    return_dt = datetime.strptime(return_str, fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
+            # Parse departure and return times (12-hour or 24-hour formats)
+            return_flight = flight['return_flight']
+            depart_dt = _parse_datetime(f"{flight['departure_date']} {flight['departure_time']}")
+            return_dt = _parse_datetime(f"{return_flight['arrival_date']} {return_flight['arrival_time']}")
+            if depart_dt is None or return_dt is None:
                 # If no format worked, skip this flight
                 continue
 
@@ -71,7 +83,7 @@ def find_optimal_trips(flights, trip_length, trip_length_unit='days', nonstop_pr
             nonstop_bonus = 0
             if nonstop_preferred:
                 outbound_nonstop = flight.get('stops', 0) == 0
-                return_nonstop = flight['return_flight'].get('stops', 0) == 0
+                return_nonstop = return_flight.get('stops', 0) == 0
 
                 if outbound_nonstop and return_nonstop:
                     nonstop_bonus = -10  # Both nonstop = highest priority
@@ -100,7 +112,7 @@ def find_optimal_trips(flights, trip_length, trip_length_unit='days', nonstop_pr
             continue
 
     # Sort by score (best matches first)
-    scored_flights.sort(key=lambda x: x['duration_match_score'])
+    scored_flights.sort(key=itemgetter('duration_match_score'))
 
     return scored_flights
 